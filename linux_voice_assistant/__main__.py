@@ -201,6 +201,9 @@ async def main() -> None:
     state.distance_sensor_model = (
         pref_distance_model if (core_config.distance_sensor_model is None) else str(core_config.distance_sensor_model)
     )
+    state.distance_sensor_int_gpio = (
+        None if (core_config.distance_sensor_int_gpio is None) else int(core_config.distance_sensor_int_gpio)
+    )
     state.vision_enabled = (
         pref_vision_enabled if (core_config.vision_enabled is None) else bool(core_config.vision_enabled)
     )
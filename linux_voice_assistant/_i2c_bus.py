@@ -0,0 +1,49 @@
+"""Process-wide I2C bus shared by the distance readers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# VL53L0X/VL53L1X both support I2C Fast-mode.
+I2C_FAST_MODE_HZ = 400_000
+# Raspberry Pi device tree node of the ARM I2C bus behind board.SCL/SDA.
+_I2C_CLOCK_PATH = Path("/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency")
+
+_I2C: Optional[Any] = None
+_LOCK = threading.Lock()
+
+
+def get_i2c() -> Any:
+    """Return the shared ``busio.I2C`` on the board's SCL/SDA pins.
+
+    Opening a second ``busio.I2C`` on the same pins can fail, so every reader
+    (and every reinit) reuses one instance. On Linux the bus clock comes from
+    the device tree, not from Python; see ``docs/tuning.md``.
+    """
+    global _I2C
+    with _LOCK:
+        if _I2C is None:
+            import board  # type: ignore
+            import busio  # type: ignore
+
+            _I2C = busio.I2C(board.SCL, board.SDA)
+            _log_bus_clock()
+        return _I2C
+
+
+def _log_bus_clock() -> None:
+    try:
+        clock_hz = int.from_bytes(_I2C_CLOCK_PATH.read_bytes()[:4], "big")
+    except OSError:
+        return
+    if clock_hz < I2C_FAST_MODE_HZ:
+        _LOGGER.info(
+            "I2C bus at %s Hz; add dtparam=i2c_arm_baudrate=%s to config.txt for Fast-mode",
+            clock_hz,
+            I2C_FAST_MODE_HZ,
+        )
@@ -43,6 +43,7 @@ class CoreConfig:
     distance_activation: Optional[bool] = None
     distance_activation_threshold_mm: Optional[float] = None
     distance_sensor_model: Optional[str] = None
+    distance_sensor_int_gpio: Optional[int] = None
     vision_enabled: Optional[bool] = None
     attention_required: Optional[bool] = None
     vision_cooldown_s: Optional[float] = None
@@ -0,0 +1,117 @@
+"""Background polling of distance readers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Optional, Sequence
+
+from .distance_reader import DistanceReader
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DistancePoller:
+    """Poll distance readers on one background thread.
+
+    Every ``interval_s`` the thread reads each reader in turn and stores the
+    result with its timestamp, so callers get the latest reading without
+    waiting on I2C or the sensor's integration time. A reading older than
+    ``staleness_s`` (e.g. a stuck bus) is reported as ``None``.
+
+    Keep one poller per set of readers for the whole process. Consumers
+    ``subscribe`` a callback to hear about new rounds and ``unsubscribe`` when
+    done; that never stops the thread, so one consumer leaving cannot starve
+    another. ``start`` waits for a thread still finishing after
+    ``stop(wait=False)``, so two threads never read the same sensor at once.
+    """
+
+    def __init__(
+        self,
+        readers: Sequence[DistanceReader],
+        *,
+        interval_s: float = 1.0,
+        staleness_s: float = 3.0,
+    ) -> None:
+        self._readers = tuple(readers)
+        self._interval_s = max(0.01, float(interval_s))
+        self._staleness_s = max(self._interval_s, float(staleness_s))
+        self._latest: dict[int, tuple[float, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._control = threading.Lock()
+        self._subscribers: set[Callable[[], None]] = set()
+
+    def subscribe(self, on_sample: Callable[[], None]) -> None:
+        """Run ``on_sample`` on the poller thread after each round; starts polling."""
+        with self._lock:
+            self._subscribers.add(on_sample)
+        self.start()
+
+    def unsubscribe(self, on_sample: Callable[[], None]) -> None:
+        """Stop notifying ``on_sample``; polling continues for other consumers."""
+        with self._lock:
+            self._subscribers.discard(on_sample)
+
+    def start(self) -> None:
+        """Start the polling thread if it is not running.
+
+        Only blocks after an explicit ``stop``, for up to one read while the
+        stopping thread finishes.
+        """
+        with self._control:
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            if not self._stop.is_set():
+                return
+            thread.join()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="lva-distance-poller",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, *, wait: bool = True) -> None:
+        """Stop polling for every consumer; with ``wait=False`` the thread
+        exits after its current read."""
+        self._stop.set()
+        if wait and self._thread is not None:
+            self._thread.join(timeout=2.0)
+
+    def latest(self, reader: DistanceReader) -> Optional[float]:
+        """Last reading of ``reader`` in mm, or None if missing or stale."""
+        with self._lock:
+            entry = self._latest.get(id(reader))
+        if entry is None:
+            return None
+        read_at, value = entry
+        if (time.monotonic() - read_at) > self._staleness_s:
+            return None
+        return value
+
+    def poll_once(self) -> None:
+        for reader in self._readers:
+            try:
+                value = reader.read_distance_mm()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Distance read failed")
+                value = None
+            entry = (time.monotonic(), value)
+            with self._lock:
+                self._latest[id(reader)] = entry
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.poll_once()
+            with self._lock:
+                subscribers = tuple(self._subscribers)
+            for on_sample in subscribers:
+                on_sample()
+            self._stop.wait(self._interval_s)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Optional, Protocol
+import statistics
+import types
+from collections import deque
+from typing import Any, Callable, Optional, Protocol
 
 
 class DistanceReader(Protocol):
@@ -15,6 +18,12 @@ class DistanceReader(Protocol):
     def read_distance_mm(self) -> Optional[float]:
         ...
 
+    async def read_distance_mm_async(self) -> Optional[float]:
+        ...
+
+    def latest_smoothed_mm(self) -> Optional[float]:
+        ...
+
     def read_mm(self) -> Optional[float]:
         ...
 
@@ -23,3 +32,54 @@ class DistanceReader(Protocol):
 
     def set_intermeasurement_ms(self, intermeasurement_ms: int) -> bool:
         ...
+
+
+def property_getter(obj: Any, name: str, default: Any = None) -> Callable[[], Any]:
+    """Return a zero-argument callable reading ``obj.<name>``.
+
+    Driver properties are bound to their getter function once, so per-poll
+    reads skip the attribute lookup and descriptor dispatch. Attributes that
+    are not plain properties fall back to ``getattr`` with ``default``.
+    """
+    prop = getattr(type(obj), name, None)
+    if isinstance(prop, property) and (prop.fget is not None):
+        return types.MethodType(prop.fget, obj)
+    return lambda: getattr(obj, name, default)
+
+
+class DistanceSmoother:
+    """Moving average (or median) over the last ``window`` valid readings.
+
+    The average keeps a running sum, so each update is O(1). A missing reading
+    (``None``) evicts the oldest sample instead of being averaged in: isolated
+    out-of-range spikes cost one sample, while a target that is gone for
+    ``window`` polls empties the buffer. ``value`` stays ``None`` until
+    ``window`` samples agree, so single readings never pass as smoothed.
+    """
+
+    def __init__(self, window: int = 5, *, use_median: bool = False) -> None:
+        self._window = max(1, int(window))
+        self._use_median = use_median
+        self._samples: deque[float] = deque()
+        self._sum = 0.0
+
+    def add(self, value: Optional[float]) -> None:
+        samples = self._samples
+        if value is None:
+            if samples:
+                self._sum -= samples.popleft()
+            if not samples:
+                self._sum = 0.0
+            return
+        if len(samples) == self._window:
+            self._sum -= samples.popleft()
+        samples.append(value)
+        self._sum += value
+
+    def value(self) -> Optional[float]:
+        samples = self._samples
+        if len(samples) < self._window:
+            return None
+        if self._use_median:
+            return float(statistics.median(samples))
+        return self._sum / len(samples)
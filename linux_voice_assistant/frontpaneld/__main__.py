@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import socket
@@ -18,6 +17,7 @@ from ..local_ipc import (
     CONTROL_SOCKET_PATH,
     GPIO_EVENT_SOCKET_PATH,
     IPC_DIR,
+    decode_packet,
     normalize_message,
     send_ipc_message,
 )
@@ -38,7 +38,7 @@ class _IpcEventProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data: bytes, _addr) -> None:  # type: ignore[override]
         try:
-            packet = json.loads(data.decode("utf-8"))
+            packet = decode_packet(data)
             if not isinstance(packet, dict):
                 return
             message = normalize_message(packet, default_source="core")
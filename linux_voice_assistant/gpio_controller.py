@@ -29,6 +29,7 @@ BUTTON_MUTE_GPIO = 17
 BUTTON_VOL_UP_GPIO = 22
 BUTTON_VOL_DOWN_GPIO = 23
 
+# LED_GPIO/COUNT/BRIGHTNESS are duplicated in script/led_off.py.
 LED_GPIO = 12
 LED_COUNT = 14
 LED_BRIGHTNESS = 70
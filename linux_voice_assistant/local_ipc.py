@@ -11,6 +11,11 @@ import time
 from pathlib import Path
 from typing import Callable, Optional
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 _LOGGER = logging.getLogger(__name__)
 
 IPC_DIR = Path("/tmp/lva-ipc")
@@ -37,6 +42,28 @@ def build_message(
     }
 
 
+def encode_message(message: IpcMessage) -> bytes:
+    """Serialize an IPC envelope to compact UTF-8 JSON (orjson when installed).
+
+    orjson rejects some payloads the stdlib accepts (non-str keys, numpy
+    scalars); those fall back to ``json.dumps`` so the output does not depend
+    on the speedups extra.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(message)
+        except TypeError:
+            pass
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+def decode_packet(data: bytes) -> object:
+    """Parse a raw IPC datagram without an intermediate str decode."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def normalize_message(packet: dict[str, object], *, default_source: str = "external") -> Optional[IpcMessage]:
     """Normalize legacy and current packet formats into IPC envelope."""
     packet_type = packet.get("type")
@@ -73,7 +100,7 @@ class _ControlProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data: bytes, _addr) -> None:  # type: ignore[override]
         try:
-            payload = json.loads(data.decode("utf-8"))
+            payload = decode_packet(data)
             if not isinstance(payload, dict):
                 return
             message = normalize_message(payload)
@@ -194,7 +221,7 @@ class LocalIpcBridge:
         source: str = "core",
     ) -> None:
         message = build_message(message_type, payload, source=source)
-        encoded = json.dumps(message, separators=(",", ":")).encode("utf-8")
+        encoded = encode_message(message)
         try:
             self._event_socket.sendto(encoded, str(socket_path))
         except FileNotFoundError:
@@ -222,7 +249,11 @@ def send_ipc_message(
 ) -> None:
     """Send a one-shot IPC message to a unix datagram socket."""
     packet = build_message(message_type, payload, source=source)
-    encoded = json.dumps(packet, separators=(",", ":")).encode("utf-8")
+    send_ipc_bytes(socket_path, encode_message(packet))
+
+
+def send_ipc_bytes(socket_path: Path, encoded: bytes) -> None:
+    """Send an already-serialized IPC envelope to a unix datagram socket."""
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
     try:
         sock.setblocking(False)
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
 
     from .gpio_controller import LvaGpioController
     from .local_ipc import LocalIpcBridge
+    from .distance_poller import DistancePoller
     from .distance_reader import DistanceReader
     from .entity import (
         DistanceSensorEntity,
@@ -210,11 +211,13 @@ class ServerState:
     ipc_bridge: "Optional[LocalIpcBridge]" = None
     gpio_controller: "Optional[LvaGpioController]" = None
     distance_reader: "Optional[DistanceReader]" = None
+    distance_poller: "Optional[DistancePoller]" = None
     wake_word_detection_enabled: bool = True
     distance_activation_enabled: bool = False
     distance_activation_sound_enabled: bool = True
     distance_activation_threshold_mm: float = 120.0
     distance_sensor_model: str = "l0x"
+    distance_sensor_int_gpio: Optional[int] = None
     vision_enabled: bool = True
     attention_required: bool = True
     vision_cooldown_s: float = 4.0
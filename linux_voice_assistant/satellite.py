@@ -80,6 +80,7 @@ from .entity import (
     WakeWordThresholdNumberEntity,
     WakeWordThresholdPresetSelectEntity,
 )
+from .distance_poller import DistancePoller
 from .distance_reader import DistanceReader
 from .local_ipc import VISD_SOCKET_PATH, IpcMessage
 from .vl53l1x_reader import Vl53l1xReader
@@ -120,6 +121,7 @@ class VoiceSatelliteProtocol(APIServer):
         self._distance_mm: Optional[float] = None
         self._distance_reader: Optional[DistanceReader] = None
         self._distance_task: Optional[asyncio.Task[None]] = None
+        self._distance_poller: Optional[DistancePoller] = None
         self._distance_last_publish = 0.0
         self._distance_activation_latched = False
         self._distance_last_trigger = 0.0
@@ -1308,20 +1310,50 @@ class VoiceSatelliteProtocol(APIServer):
 
         if self.state.distance_reader is None:
             if self.state.distance_sensor_model == "l1x":
-                self.state.distance_reader = Vl53l1xReader()
+                self.state.distance_reader = Vl53l1xReader(
+                    gpio_int_pin=self.state.distance_sensor_int_gpio,
+                    raw_i2c=True,
+                )
             else:
                 self.state.distance_reader = Vl53l0xReader()
+        # Sensor I/O runs on the poller thread; the loop only reads its slot.
+        # One poller per reader runs for the whole process (so two threads can
+        # never read the same sensor); each connection only subscribes to it.
+        if self.state.distance_poller is None:
+            self.state.distance_poller = DistancePoller([self.state.distance_reader])
         self._distance_reader = self.state.distance_reader
+        self._distance_poller = self.state.distance_poller
         self._distance_task = asyncio.create_task(self._distance_loop())
 
     async def _distance_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        sample_ready = asyncio.Event()
+
+        def _on_sample() -> None:
+            try:
+                loop.call_soon_threadsafe(sample_ready.set)
+            except RuntimeError:
+                # Loop already closed during shutdown.
+                pass
+
+        poller = self._distance_poller
+        if poller is not None:
+            poller.subscribe(_on_sample)
+        try:
+            await self._distance_loop_body(sample_ready)
+        finally:
+            # Other connections may still be using the shared poller.
+            if poller is not None:
+                poller.unsubscribe(_on_sample)
+
+    async def _distance_loop_body(self, sample_ready: asyncio.Event) -> None:
         while True:
             try:
-                now = time.monotonic()
-                if self._distance_reader is not None:
-                    self._distance_mm = self._distance_reader.read_distance_mm()
+                if (self._distance_reader is not None) and (self._distance_poller is not None):
+                    self._distance_mm = self._distance_poller.latest(self._distance_reader)
                 else:
                     self._distance_mm = None
+                now = time.monotonic()
 
                 self._handle_distance_activation(now)
 
@@ -1358,7 +1390,13 @@ class VoiceSatelliteProtocol(APIServer):
                 if (now - self._distance_last_publish) >= 5.0:
                     self._publish_distance_state()
                     self._distance_last_publish = now
-                await asyncio.sleep(1.0)
+                # Wake on each fresh reading; the timeout keeps the vision/VAD
+                # deadline checks ticking if the poller stalls.
+                try:
+                    await asyncio.wait_for(sample_ready.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                sample_ready.clear()
             except asyncio.CancelledError:
                 raise
             except Exception:  # noqa: BLE001
@@ -2117,6 +2155,7 @@ class VoiceSatelliteProtocol(APIServer):
         if self._distance_task is not None:
             self._distance_task.cancel()
             self._distance_task = None
+        self._distance_poller = None
 
         if self.state.mute_switch_entity is not None:
             self.state.mute_switch_entity.sync_with_state()
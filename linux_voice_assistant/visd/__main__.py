@@ -4,38 +4,94 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import socket
 import subprocess
 import time
 import uuid
-from typing import Optional
+from typing import Any, Optional
+
+import numpy as np
 
 from ..config import load_config
-from ..local_ipc import CONTROL_SOCKET_PATH, IPC_DIR, VISD_SOCKET_PATH, normalize_message, send_ipc_message
-from .detector import Detector, SimpleFaceGlanceDetector
+from ..local_ipc import (
+    CONTROL_SOCKET_PATH,
+    IPC_DIR,
+    VISD_SOCKET_PATH,
+    decode_packet,
+    normalize_message,
+    send_ipc_message,
+)
+from .detector import DetectionResult, Detector, SimpleFaceGlanceDetector
+
+try:
+    import cv2  # type: ignore
+
+    _CV2_IMPORT_ERROR: Optional[Exception] = None
+except Exception as _err:  # noqa: BLE001
+    cv2 = None  # type: ignore[assignment]
+    _CV2_IMPORT_ERROR = _err
+
+try:
+    from picamera2 import Picamera2  # type: ignore
+except Exception:  # noqa: BLE001
+    Picamera2 = None
 
 _LOGGER = logging.getLogger(__name__)
+# Datagrams drained per readiness callback on the visd socket.
+_IPC_DRAIN_BATCH = 16
+# Largest datagram read in one piece (asyncio's own datagram reads allow 256KiB);
+# anything bigger is reported as truncated rather than decoded.
+_IPC_MAX_PACKET = 65536
+# A single frame at or above this FACE_TOWARD confidence ends the burst early.
+_EARLY_EXIT_CONFIDENCE = 0.7
 _FACE_SNAPSHOT_PATH = "/face/latest.jpg"
-
-
-class _VisdProtocol(asyncio.DatagramProtocol):
-    def __init__(self, daemon: "VisionDaemon") -> None:
-        self.daemon = daemon
-
-    def datagram_received(self, data: bytes, _addr) -> None:  # type: ignore[override]
-        try:
-            payload = json.loads(data.decode("utf-8"))
-            if not isinstance(payload, dict):
-                return
-            message = normalize_message(payload, default_source="core")
-            if message is None:
-                return
-            self.daemon.handle_message(message)
-        except Exception:  # noqa: BLE001
-            _LOGGER.exception("Invalid visd IPC packet")
+_HTTP_REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+def _http_header_template(status: int, content_type: str, *, revalidate: bool = False) -> bytes:
+    """Build an encoded response header block with a %b slot for per-response headers."""
+    reason = _HTTP_REASONS.get(status, "OK")
+    # Entity-tagged responses may be stored but must be revalidated every time;
+    # everything else stays uncacheable.
+    cache_control = (
+        "no-cache, must-revalidate, max-age=0"
+        if revalidate
+        else "no-store, no-cache, must-revalidate, max-age=0"
+    )
+    headers = [
+        f"HTTP/1.1 {status} {reason}\r\n",
+        f"Content-Type: {content_type}\r\n",
+        f"Cache-Control: {cache_control}\r\n",
+        "Pragma: no-cache\r\n",
+        "Expires: 0\r\n",
+        "Connection: close\r\n",
+        "%b\r\n",
+    ]
+    return "".join(headers).encode("ascii")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return True when an If-None-Match header value covers the given entity tag."""
+    if not etag:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
 
 
 class VisionDaemon:
@@ -59,13 +115,24 @@ class VisionDaemon:
         self._height = height
         self._face_snapshot_host = str(face_snapshot_host)
         self._face_snapshot_port = int(face_snapshot_port)
-        self._transport: Optional[asyncio.transports.DatagramTransport] = None
+        self._ipc_socket: Optional[socket.socket] = None
+        self._ipc_buffer = bytearray(_IPC_MAX_PACKET)
         self._task: Optional[asyncio.Task[None]] = None
         self._http_server: Optional[asyncio.base_events.Server] = None
         self._last_face_jpeg: Optional[bytes] = None
         self._last_face_updated_at: float = 0.0
         self._last_face_uuid: str = ""
         self._placeholder_jpeg: Optional[bytes] = None
+        self._picam2: Optional[Any] = None
+        # Header blocks are encoded once; only ETag and Content-Length vary per response.
+        self._http_header_templates: dict[tuple[int, str, bool], bytes] = {
+            (200, "image/jpeg", True): _http_header_template(200, "image/jpeg", revalidate=True),
+            (304, "image/jpeg", True): _http_header_template(304, "image/jpeg", revalidate=True),
+            (400, "text/plain", False): _http_header_template(400, "text/plain"),
+            (404, "text/plain", False): _http_header_template(404, "text/plain"),
+            (405, "text/plain", False): _http_header_template(405, "text/plain"),
+            (500, "text/plain", False): _http_header_template(500, "text/plain"),
+        }
 
     async def start(self) -> None:
         IPC_DIR.mkdir(parents=True, exist_ok=True)
@@ -73,12 +140,11 @@ class VisionDaemon:
             VISD_SOCKET_PATH.unlink()
 
         loop = asyncio.get_running_loop()
-        transport, _ = await loop.create_datagram_endpoint(
-            lambda: _VisdProtocol(self),
-            local_addr=str(VISD_SOCKET_PATH),
-            family=socket.AF_UNIX,
-        )
-        self._transport = transport
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(str(VISD_SOCKET_PATH))
+        loop.add_reader(sock.fileno(), self._drain_ipc_socket)
+        self._ipc_socket = sock
         os.chmod(VISD_SOCKET_PATH, 0o666)
         self._placeholder_jpeg = await asyncio.to_thread(self._build_placeholder_jpeg)
         # Initialize with a valid image so the endpoint always serves a JPEG.
@@ -102,18 +168,55 @@ class VisionDaemon:
         if self._task is not None:
             self._task.cancel()
             self._task = None
-        if self._transport is not None:
-            self._transport.close()
-            self._transport = None
+        if self._ipc_socket is not None:
+            try:
+                asyncio.get_running_loop().remove_reader(self._ipc_socket.fileno())
+            except Exception:  # noqa: BLE001
+                pass
+            self._ipc_socket.close()
+            self._ipc_socket = None
         if self._http_server is not None:
             self._http_server.close()
             self._http_server = None
+        self._close_picamera2()
         try:
             if VISD_SOCKET_PATH.exists():
                 VISD_SOCKET_PATH.unlink()
         except Exception:  # noqa: BLE001
             pass
 
+    def _drain_ipc_socket(self) -> None:
+        """Read every queued datagram (up to a batch) per readiness callback."""
+        sock = self._ipc_socket
+        if sock is None:
+            return
+        view = memoryview(self._ipc_buffer)
+        buffers = [view]
+        for _ in range(_IPC_DRAIN_BATCH):
+            try:
+                size, _ancdata, flags, _addr = sock.recvmsg_into(buffers)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                _LOGGER.exception("visd IPC socket read failed")
+                return
+            if flags & socket.MSG_TRUNC:
+                _LOGGER.warning("Dropped visd IPC packet larger than %s bytes", _IPC_MAX_PACKET)
+                continue
+            self._handle_ipc_packet(bytes(view[:size]))
+
+    def _handle_ipc_packet(self, data: bytes) -> None:
+        try:
+            payload = decode_packet(data)
+            if not isinstance(payload, dict):
+                return
+            message = normalize_message(payload, default_source="core")
+            if message is None:
+                return
+            self.handle_message(message)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Invalid visd IPC packet")
+
     def handle_message(self, message: dict[str, object]) -> None:
         msg_type = str(message.get("type", "")).strip().upper()
         payload_obj = message.get("payload")
@@ -134,8 +237,7 @@ class VisionDaemon:
         confidence = 0.0
         error = ""
         try:
-            frames = await asyncio.to_thread(self._capture_frames)
-            detection = self._detector.analyze(frames)
+            frames, detection = await self._capture_and_analyze()
             result_state = detection.state
             confidence = detection.confidence
             self._update_last_face_snapshot(frames, detection)
@@ -155,11 +257,45 @@ class VisionDaemon:
             payload["error"] = error
         send_ipc_message(CONTROL_SOCKET_PATH, "VISION_GLANCE_RESULT", payload, source="visd")
 
-    def _capture_frames(self):
-        try:
-            import cv2  # type: ignore
-        except Exception as err:  # noqa: BLE001
-            raise RuntimeError(f"opencv_unavailable: {err}") from err
+    async def _capture_and_analyze(self) -> tuple[list[np.ndarray], DetectionResult]:
+        """Capture burst frames, analyzing each one as it arrives.
+
+        The burst stops as soon as a frame yields a confident FACE_TOWARD; the
+        detector keeps the running best across frames otherwise.
+        """
+        self._detector.reset()
+        detection = DetectionResult(state="NO_FACE", confidence=0.0)
+        frames: list[np.ndarray] = []
+        # Once libcamera has taken the camera for the fallback it keeps it, so
+        # OpenCV would only fail to open it again.
+        if self._picam2 is None:
+            cap = await asyncio.to_thread(self._open_camera)
+            try:
+                deadline = time.monotonic() + self._burst_seconds
+                while (time.monotonic() < deadline) and (len(frames) < self._frame_count):
+                    frame = await asyncio.to_thread(self._read_frame, cap)
+                    if frame is None:
+                        continue
+                    frames.append(frame)
+                    detection = await asyncio.to_thread(self._detector.analyze_one, frame)
+                    if (detection.state == "FACE_TOWARD") and (
+                        detection.confidence >= _EARLY_EXIT_CONFIDENCE
+                    ):
+                        break
+            finally:
+                cap.release()
+        if not frames:
+            fallback_frame = await asyncio.to_thread(self._capture_single_frame_fallback)
+            if fallback_frame is not None:
+                frames.append(fallback_frame)
+                detection = await asyncio.to_thread(self._detector.analyze_one, fallback_frame)
+        if not frames:
+            raise RuntimeError("camera_no_frames")
+        return frames, detection
+
+    def _open_camera(self):
+        if cv2 is None:
+            raise RuntimeError(f"opencv_unavailable: {_CV2_IMPORT_ERROR}") from _CV2_IMPORT_ERROR
 
         cap = cv2.VideoCapture(self._camera_index)
         if not cap.isOpened():
@@ -168,22 +304,14 @@ class VisionDaemon:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, float(self._width))
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, float(self._height))
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 1.0)
+        return cap
 
-        frames = []
-        deadline = time.monotonic() + self._burst_seconds
-        while (time.monotonic() < deadline) and (len(frames) < self._frame_count):
-            ok, frame = cap.read()
-            if not ok:
-                continue
-            frames.append(frame)
-        cap.release()
-        if not frames:
-            fallback_frame = self._capture_single_frame_rpicam(cv2)
-            if fallback_frame is not None:
-                frames.append(fallback_frame)
-        if not frames:
-            raise RuntimeError("camera_no_frames")
-        return frames
+    @staticmethod
+    def _read_frame(cap) -> Optional[np.ndarray]:
+        ok, frame = cap.read()
+        if not ok:
+            return None
+        return frame
 
     def _update_last_face_snapshot(self, frames, detection) -> None:
         face_box = getattr(detection, "face_box", None)
@@ -192,9 +320,7 @@ class VisionDaemon:
             return
         if face_frame_index < 0 or face_frame_index >= len(frames):
             return
-        try:
-            import cv2  # type: ignore
-        except Exception:
+        if cv2 is None:
             return
 
         frame = frames[face_frame_index]
@@ -213,19 +339,19 @@ class VisionDaemon:
         ok, encoded = cv2.imencode(".jpg", crop)
         if not ok:
             return
-        self._last_face_jpeg = bytes(encoded.tobytes())
+        self._last_face_jpeg = encoded.tobytes()
         self._last_face_updated_at = time.time()
         self._last_face_uuid = uuid.uuid4().hex
 
     def _build_placeholder_jpeg(self) -> bytes:
+        if cv2 is None:
+            _LOGGER.warning("Failed to build placeholder JPEG: opencv_unavailable: %s", _CV2_IMPORT_ERROR)
+            return b""
         try:
-            import cv2  # type: ignore
-            import numpy as np
-
             img = np.zeros((128, 128, 3), dtype=np.uint8)
             ok, encoded = cv2.imencode(".jpg", img)
             if ok:
-                return bytes(encoded.tobytes())
+                return encoded.tobytes()
         except Exception as err:  # noqa: BLE001
             _LOGGER.warning("Failed to build placeholder JPEG: %s", err)
         return b""
@@ -254,11 +380,15 @@ class VisionDaemon:
                 )
                 return
 
-            # Drain headers.
+            # Drain headers, keeping only the conditional request validator.
+            if_none_match = ""
             while True:
                 line = await asyncio.wait_for(reader.readline(), timeout=2.0)
                 if not line or line in (b"\r\n", b"\n"):
                     break
+                name, sep, value = line.partition(b":")
+                if sep and name.strip().lower() == b"if-none-match":
+                    if_none_match = value.decode("iso-8859-1").strip()
 
             if method != "GET":
                 await self._http_send(
@@ -279,8 +409,13 @@ class VisionDaemon:
                 )
                 return
 
+            etag = self._last_face_uuid
+            if if_none_match and _etag_matches(if_none_match, etag):
+                await self._http_send(writer, 304, b"", content_type="image/jpeg", etag=etag)
+                return
+
             body = self._last_face_jpeg or b""
-            await self._http_send(writer, 200, body, content_type="image/jpeg")
+            await self._http_send(writer, 200, body, content_type="image/jpeg", etag=etag)
         except Exception:  # noqa: BLE001
             _LOGGER.debug("HTTP snapshot request failed", exc_info=True)
             try:
@@ -300,30 +435,68 @@ class VisionDaemon:
         body: bytes,
         *,
         content_type: str,
+        etag: Optional[str] = None,
     ) -> None:
-        reason = {
-            200: "OK",
-            400: "Bad Request",
-            404: "Not Found",
-            405: "Method Not Allowed",
-            500: "Internal Server Error",
-        }.get(status, "OK")
-        headers = [
-            f"HTTP/1.1 {status} {reason}\r\n",
-            f"Content-Type: {content_type}\r\n",
-            f"Content-Length: {len(body)}\r\n",
-            "Cache-Control: no-store, no-cache, must-revalidate, max-age=0\r\n",
-            "Pragma: no-cache\r\n",
-            "Expires: 0\r\n",
-            "Connection: close\r\n",
-            "\r\n",
-        ]
-        writer.write("".join(headers).encode("ascii") + body)
+        revalidate = etag is not None
+        key = (status, content_type, revalidate)
+        template = self._http_header_templates.get(key)
+        if template is None:
+            template = _http_header_template(status, content_type, revalidate=revalidate)
+            self._http_header_templates[key] = template
+        extra = b""
+        if etag is not None:
+            extra = b'ETag: "%b"\r\n' % etag.encode("ascii")
+        if status == 304:
+            # 304 carries no body, so no Content-Length either.
+            writer.write(template % extra)
+        else:
+            extra += b"Content-Length: %d\r\n" % len(body)
+            # Scatter write: avoid copying the body into a joined header+body buffer.
+            writer.writelines((template % extra, body))
         await writer.drain()
         writer.close()
         await writer.wait_closed()
 
-    def _capture_single_frame_rpicam(self, cv2_module):
+    def _capture_single_frame_fallback(self) -> Optional[np.ndarray]:
+        if Picamera2 is not None:
+            frame = self._capture_single_frame_picamera2()
+            if frame is not None:
+                return frame
+        return self._capture_single_frame_rpicam()
+
+    def _capture_single_frame_picamera2(self) -> Optional[np.ndarray]:
+        try:
+            picam2 = self._picam2
+            if picam2 is None:
+                picam2 = Picamera2(self._camera_index)
+                # libcamera "RGB888" is laid out B,G,R in memory, i.e. what OpenCV expects.
+                picam2.configure(
+                    picam2.create_still_configuration(
+                        main={"size": (self._width, self._height), "format": "RGB888"},
+                    )
+                )
+                self._picam2 = picam2
+            picam2.start()
+            try:
+                return picam2.capture_array("main")
+            finally:
+                picam2.stop()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("picamera2 fallback failed: %s", err)
+            self._close_picamera2()
+            return None
+
+    def _close_picamera2(self) -> None:
+        picam2 = self._picam2
+        if picam2 is None:
+            return
+        try:
+            picam2.close()
+        except Exception:  # noqa: BLE001
+            pass
+        self._picam2 = None
+
+    def _capture_single_frame_rpicam(self) -> Optional[np.ndarray]:
         cmd = [
             "rpicam-jpeg",
             "-n",
@@ -353,11 +526,9 @@ class VisionDaemon:
             return None
 
         try:
-            import numpy as np
-
-            frame = cv2_module.imdecode(
+            frame = cv2.imdecode(
                 np.frombuffer(result.stdout, dtype=np.uint8),
-                cv2_module.IMREAD_COLOR,
+                cv2.IMREAD_COLOR,
             )
             return frame
         except Exception as err:  # noqa: BLE001
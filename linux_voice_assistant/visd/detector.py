@@ -3,10 +3,42 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional
 
 import numpy as np
 
+try:
+    import cv2  # type: ignore
+except Exception:  # noqa: BLE001
+    cv2 = None  # type: ignore[assignment]
+
+# Parsed Haar cascades shared by every detector in the process, keyed by file name.
+_CASCADE_CACHE: dict[str, Any] = {}
+
+
+def load_cascade(name: str, *, shared: bool = True) -> Optional[Any]:
+    """Return a CascadeClassifier for a bundled OpenCV Haar cascade.
+
+    Shared instances are parsed once per process. A classifier must not run
+    ``detectMultiScale`` from two threads at once, so concurrent callers should
+    ask for a private instance with ``shared=False``.
+    """
+    if shared:
+        cascade = _CASCADE_CACHE.get(name)
+        if cascade is not None:
+            return cascade
+    if cv2 is None:
+        return None
+    try:
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + name)
+    except Exception:  # noqa: BLE001
+        return None
+    if cascade.empty():
+        return None
+    if shared:
+        _CASCADE_CACHE[name] = cascade
+    return cascade
+
 
 @dataclass
 class DetectionResult:
@@ -17,75 +49,110 @@ class DetectionResult:
 
 
 class Detector:
-    """Detector interface."""
+    """Detector interface.
 
-    def analyze(self, frames: Iterable[np.ndarray]) -> DetectionResult:
+    Frames are BGR or already-grayscale arrays. They can be analyzed as a
+    batch with ``analyze`` or incrementally:
+    ``reset`` starts a new glance and each ``analyze_one`` call folds one more
+    frame in and returns the result for all frames seen so far.
+    """
+
+    def reset(self) -> None:
+        """Start a new glance."""
+
+    def analyze_one(self, frame: np.ndarray) -> DetectionResult:
         raise NotImplementedError
 
+    def analyze(self, frames: Iterable[np.ndarray]) -> DetectionResult:
+        self.reset()
+        result = DetectionResult(state="NO_FACE", confidence=0.0)
+        for frame in frames:
+            result = self.analyze_one(frame)
+        return result
 
-class SimpleFaceGlanceDetector(Detector):
-    """Low-cost face presence + rough orientation detector."""
 
-    def __init__(self) -> None:
-        self._cascade = None
-        try:
-            import cv2  # type: ignore
+class SimpleFaceGlanceDetector(Detector):
+    """Low-cost face presence + rough orientation detector.
 
-            cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-            self._cascade = cv2.CascadeClassifier(cascade_path)
-        except Exception:
-            self._cascade = None
+    ``analyze``/``analyze_one`` reuse an internal grayscale buffer and keep
+    per-glance state, so they are not thread-safe; call them from a single
+    task/thread only.
+    """
 
-    def analyze(self, frames: Iterable[np.ndarray]) -> DetectionResult:
+    def __init__(self) -> None:
+        self._cascade = load_cascade("haarcascade_frontalface_default.xml")
+        self._gray_buf: Optional[np.ndarray] = None
+        self.reset()
+
+    def _gray_buffer(self, frame: np.ndarray) -> np.ndarray:
+        shape = frame.shape[:2]
+        if self._gray_buf is None or self._gray_buf.shape != shape:
+            self._gray_buf = np.empty(shape, dtype=np.uint8)
+        return self._gray_buf
+
+    def reset(self) -> None:
+        self._frame_index = 0
+        self._best_conf = 0.0
+        self._toward_conf = 0.0
+        self._seen_face = False
+        self._best_face_frame_index: Optional[int] = None
+        self._best_face_box: Optional[tuple[int, int, int, int]] = None
+
+    def analyze_one(self, frame: np.ndarray) -> DetectionResult:
+        frame_index = self._frame_index
+        self._frame_index += 1
         if self._cascade is None:
             return DetectionResult(state="NO_FACE", confidence=0.0)
 
-        import cv2  # type: ignore
-
-        best_conf = 0.0
-        toward_conf = 0.0
-        seen_face = False
-        best_face_frame_index: Optional[int] = None
-        best_face_box: Optional[tuple[int, int, int, int]] = None
-        for frame_index, frame in enumerate(frames):
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            faces = self._cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.15,
-                minNeighbors=3,
-                minSize=(28, 28),
-            )
-            if len(faces) == 0:
-                continue
-            seen_face = True
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            gray = self._gray_buffer(frame)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+        faces = self._cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.15,
+            minNeighbors=3,
+            minSize=(28, 28),
+        )
+        if len(faces) > 0:
+            self._seen_face = True
             h, w = gray.shape
-            area_total = float(max(1, w * h))
-            for (x, y, fw, fh) in faces:
-                face_area = float(fw * fh) / area_total
-                cx = x + (fw / 2.0)
-                cy = y + (fh / 2.0)
-                center_dx = abs((cx / max(1.0, float(w))) - 0.5)
-                center_dy = abs((cy / max(1.0, float(h))) - 0.5)
+            # Per-frame invariants, hoisted out of the per-face loop.
+            inv_area = 1.0 / float(max(1, w * h))
+            inv_w = 1.0 / float(max(1, w))
+            inv_h = 1.0 / float(max(1, h))
+            best_conf = self._best_conf
+            toward_conf = self._toward_conf
+            # tolist() yields plain Python ints; numpy scalar math is far slower here.
+            for (x, y, fw, fh) in faces.tolist():
+                face_area = (fw * fh) * inv_area
+                center_dx = abs(((x + (fw * 0.5)) * inv_w) - 0.5)
+                center_dy = abs(((y + (fh * 0.5)) * inv_h) - 0.5)
                 centered = max(0.0, 1.0 - ((center_dx * 1.8) + (center_dy * 1.2)))
-                conf = max(0.0, min(1.0, (face_area * 6.5) + (centered * 0.7)))
+                conf = min(1.0, (face_area * 6.5) + (centered * 0.7))
                 if conf >= best_conf:
-                    best_face_frame_index = frame_index
-                    best_face_box = (int(x), int(y), int(fw), int(fh))
-                best_conf = max(best_conf, conf)
+                    best_conf = conf
+                    self._best_face_frame_index = frame_index
+                    self._best_face_box = (x, y, fw, fh)
                 toward_conf = max(toward_conf, centered)
+            self._best_conf = best_conf
+            self._toward_conf = toward_conf
+        return self._result()
 
-        if not seen_face:
+    def _result(self) -> DetectionResult:
+        if not self._seen_face:
             return DetectionResult(state="NO_FACE", confidence=0.0)
-        if toward_conf >= 0.45:
+        if self._toward_conf >= 0.45:
             return DetectionResult(
                 state="FACE_TOWARD",
-                confidence=max(best_conf, toward_conf),
-                face_frame_index=best_face_frame_index,
-                face_box=best_face_box,
+                confidence=max(self._best_conf, self._toward_conf),
+                face_frame_index=self._best_face_frame_index,
+                face_box=self._best_face_box,
             )
         return DetectionResult(
             state="FACE_AWAY",
-            confidence=max(0.2, min(0.95, best_conf)),
-            face_frame_index=best_face_frame_index,
-            face_box=best_face_box,
+            confidence=max(0.2, min(0.95, self._best_conf)),
+            face_frame_index=self._best_face_frame_index,
+            face_box=self._best_face_box,
         )
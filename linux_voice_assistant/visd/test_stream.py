@@ -4,31 +4,47 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import ctypes
+import ctypes.util
 import json
 import logging
 import os
+import select
 import socket
 import subprocess
+import sys
 import threading
 import time
 from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from http import HTTPStatus
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
 import numpy as np
 
-from ..config import load_config
-from ..config import resolve_repo_path
+from ..config import get_config_path, load_config, resolve_repo_path
 from ..gpio_controller import LED_BRIGHTNESS, LED_COUNT, LED_GPIO, LedMode, Ws2812Bar
-from .detector import SimpleFaceGlanceDetector
+from .detector import SimpleFaceGlanceDetector, load_cascade
 
 _LOGGER = logging.getLogger(__name__)
 STREAM_HOST = "0.0.0.0"
 STREAM_PORT = 8088
 DETECTION_WIDTH = 320
 DETECTION_HEIGHT = 240
+# Upper bound for cascade windows: nothing useful is larger than ~90% of the
+# detection frame height, so the coarsest pyramid levels are skipped.
+DETECTION_MAX_OBJECT = int(DETECTION_HEIGHT * 0.9)
+# With camera JPEG passthrough the annotated overlay is re-encoded at most this often.
+OVERLAY_INTERVAL_S = 1.0
+# Above this smoothed per-frame cost HOG switches to a coarser scan.
+HOG_FAST_PROCESSING_MS = 250.0
+# Static-scene gate: mean absolute difference of a 32x24 gray thumbnail below
+# which detector results are reused, for at most SCENE_STATIC_MAX_S.
+SCENE_GATE_SIZE = (32, 24)
+SCENE_CHANGE_THRESHOLD = 3.0
+SCENE_STATIC_MAX_S = 2.0
 
 
 def _clamp_confidence(value: float) -> float:
@@ -52,12 +68,38 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-@dataclass
-class StreamState:
-    frame_jpeg: bytes = b""
+@dataclass(frozen=True)
+class StreamSnapshot:
     frame_seq: int = 0
+    frame_jpeg: bytes = b""
+    overlay_jpeg: bytes = b""
     status: dict[str, Any] = field(default_factory=dict)
-    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class StreamState:
+    """Latest stream output, published as one immutable snapshot.
+
+    Only the capture loop writes, replacing ``current`` wholesale; readers take
+    a consistent view with a single attribute load and no lock.
+    """
+
+    current: StreamSnapshot = field(default_factory=StreamSnapshot)
+
+    def publish(
+        self,
+        status: dict[str, Any],
+        *,
+        frame_jpeg: bytes | None = None,
+        overlay_jpeg: bytes | None = None,
+    ) -> None:
+        prev = self.current
+        self.current = StreamSnapshot(
+            frame_seq=prev.frame_seq + 1 if frame_jpeg is not None else prev.frame_seq,
+            frame_jpeg=prev.frame_jpeg if frame_jpeg is None else frame_jpeg,
+            overlay_jpeg=prev.overlay_jpeg if overlay_jpeg is None else overlay_jpeg,
+            status=status,
+        )
 
 
 @dataclass
@@ -67,8 +109,39 @@ class VisionSettings:
     min_confidence: float
 
 
+_JPEG_SOI = b"\xff\xd8"
+_JPEG_EOI = b"\xff\xd9"
+# Bound on buffered MJPEG bytes without a complete frame before resyncing.
+_MJPEG_MAX_BUFFER = 4 * 1024 * 1024
+
+
+def _extract_latest_jpeg(buf: bytearray) -> bytes | None:
+    """Pop every complete JPEG from an MJPEG byte buffer and return the newest.
+
+    Bytes up to the end of the last complete frame are removed from ``buf``;
+    a trailing partial frame is kept for the next read.
+    """
+    latest = None
+    consumed = 0
+    while True:
+        soi = buf.find(_JPEG_SOI, consumed)
+        if soi < 0:
+            # No frame start in the remainder; keep a trailing 0xFF in case the
+            # SOI marker was split across reads.
+            consumed = max(consumed, len(buf) - 1 if buf.endswith(b"\xff") else len(buf))
+            break
+        eoi = buf.find(_JPEG_EOI, soi + 2)
+        if eoi < 0:
+            consumed = soi
+            break
+        consumed = eoi + 2
+        latest = bytes(buf[soi:consumed])
+    del buf[:consumed]
+    return latest
+
+
 class _RpiCamMjpegSource:
-    """Capture single JPEG frames using rpicam-jpeg."""
+    """Capture JPEG frames from a persistent rpicam-vid MJPEG pipe."""
 
     def __init__(
         self,
@@ -82,40 +155,86 @@ class _RpiCamMjpegSource:
         self._width = width
         self._height = height
         self._fps = max(1.0, min(20.0, float(fps)))
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._buf = bytearray()
 
     def start(self) -> None:
-        return
-
-    def stop(self) -> None:
-        return
-
-    def read_jpeg(self) -> bytes | None:
+        if self._proc is not None and self._proc.poll() is None:
+            return
         cmd = [
-            "rpicam-jpeg",
+            "rpicam-vid",
             "-n",
             "-t",
-            "1",
+            "0",
+            "--codec",
+            "mjpeg",
             "--camera",
             str(self._camera_index),
             "--width",
             str(self._width),
             "--height",
             str(self._height),
+            "--framerate",
+            str(int(self._fps)),
             "-o",
             "-",
         ]
+        self._buf.clear()
         try:
-            result = subprocess.run(  # noqa: S603
+            self._proc = subprocess.Popen(  # noqa: S603
                 cmd,
-                capture_output=True,
-                timeout=max(0.8, 2.0 / self._fps),
-                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
             )
-        except Exception:  # noqa: BLE001
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("rpicam-vid non avviabile: %s", err)
+            self._proc = None
+
+    def stop(self) -> None:
+        proc = self._proc
+        self._proc = None
+        self._buf.clear()
+        if proc is None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=2.0)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def read_jpeg(self) -> bytes | None:
+        proc = self._proc
+        if proc is None or proc.stdout is None:
             return None
-        if result.returncode != 0 or not result.stdout:
+        if proc.poll() is not None:
+            _LOGGER.warning("rpicam-vid terminato (code=%s), riavvio", proc.returncode)
+            self.stop()
+            self.start()
             return None
-        return bytes(result.stdout)
+
+        fd = proc.stdout.fileno()
+        deadline = time.monotonic() + max(0.8, 2.0 / self._fps)
+        latest = None
+        while True:
+            # Drain whatever is already queued so the newest frame wins and the
+            # encoder never stalls on a full pipe.
+            timeout = 0.0 if latest is not None else deadline - time.monotonic()
+            if timeout < 0.0:
+                return None
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                return latest
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return latest
+            self._buf += chunk
+            frame = _extract_latest_jpeg(self._buf)
+            if frame is not None:
+                latest = frame
+            elif len(self._buf) > _MJPEG_MAX_BUFFER:
+                self._buf.clear()
 
 
 class _DirectLedSync:
@@ -146,173 +265,350 @@ class _DirectLedSync:
 
 
 class _PersonDetector:
-    def __init__(self) -> None:
+    """HOG + profile + upper-body person detection.
+
+    The individual ``detectMultiScale`` passes release the GIL, so they are
+    submitted to ``executor`` and run in parallel.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
         self._hog = None
-        self._profile = None
-        self._upper_body = None
         try:
             import cv2  # type: ignore
 
             hog = cv2.HOGDescriptor()
             hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
             self._hog = hog
-            profile_path = cv2.data.haarcascades + "haarcascade_profileface.xml"
-            profile = cv2.CascadeClassifier(profile_path)
-            if not profile.empty():
-                self._profile = profile
-            upper_body_path = cv2.data.haarcascades + "haarcascade_upperbody.xml"
-            upper_body = cv2.CascadeClassifier(upper_body_path)
-            if not upper_body.empty():
-                self._upper_body = upper_body
         except Exception:  # noqa: BLE001
             self._hog = None
-            self._profile = None
-            self._upper_body = None
+        self._profile = load_cascade("haarcascade_profileface.xml")
+        # The left and right profile passes run concurrently, so each needs
+        # its own classifier instance.
+        self._profile_mirrored = load_cascade("haarcascade_profileface.xml", shared=False)
+        self._upper_body = load_cascade("haarcascade_upperbody.xml")
+
+    def detect(
+        self,
+        frame: np.ndarray,
+        gray: np.ndarray,
+        mirrored: np.ndarray,
+        *,
+        fast: bool = False,
+    ) -> tuple[bool, int]:
+        """Count person hits; ``gray``/``mirrored`` are the frame's grayscale and its flip.
 
-    def detect(self, frame: np.ndarray) -> tuple[bool, int]:
-        total = 0
-        has_person = False
+        ``fast`` trades HOG recall for speed with a coarser window stride and
+        pyramid step, for use when the stream is falling behind.
+        """
         if self._hog is None and self._profile is None and self._upper_body is None:
             return False, 0
         try:
+            hog_future: Future[Any] | None = None
+            cascade_futures: list[Future[Any]] = []
             if self._hog is not None:
-                rects, _weights = self._hog.detectMultiScale(
+                hog_future = self._executor.submit(
+                    self._hog.detectMultiScale,
                     frame,
                     # Diagnostic stream: favor recall so "person" triggers sooner
                     # than "looking toward camera".
-                    winStride=(4, 4),
+                    winStride=(8, 8) if fast else (4, 4),
                     padding=(8, 8),
-                    scale=1.03,
+                    scale=1.05 if fast else 1.03,
                     hitThreshold=-0.2,
                 )
-                count = int(len(rects))
-                if count > 0:
-                    has_person = True
-                    total += count
 
             if self._profile is not None:
-                import cv2  # type: ignore
-
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                left = self._profile.detectMultiScale(
-                    gray,
-                    scaleFactor=1.08,
-                    minNeighbors=3,
-                    minSize=(22, 22),
-                )
-                mirrored = cv2.flip(gray, 1)
-                right = self._profile.detectMultiScale(
-                    mirrored,
-                    scaleFactor=1.08,
-                    minNeighbors=3,
-                    minSize=(22, 22),
-                )
-                profile_count = int(len(left)) + int(len(right))
-                if profile_count > 0:
-                    has_person = True
-                    total += profile_count
-
-                if self._upper_body is not None:
-                    upper = self._upper_body.detectMultiScale(
+                cascade_futures.append(
+                    self._executor.submit(
+                        self._profile.detectMultiScale,
                         gray,
                         scaleFactor=1.08,
                         minNeighbors=3,
-                        minSize=(36, 36),
+                        minSize=(22, 22),
+                        maxSize=(DETECTION_MAX_OBJECT, DETECTION_MAX_OBJECT),
+                    )
+                )
+                if self._profile_mirrored is not None:
+                    cascade_futures.append(
+                        self._executor.submit(
+                            self._profile_mirrored.detectMultiScale,
+                            mirrored,
+                            scaleFactor=1.08,
+                            minNeighbors=3,
+                            minSize=(22, 22),
+                            maxSize=(DETECTION_MAX_OBJECT, DETECTION_MAX_OBJECT),
+                        )
                     )
-                    upper_count = int(len(upper))
-                    if upper_count > 0:
-                        has_person = True
-                        total += upper_count
-            return has_person, total
+
+                if self._upper_body is not None:
+                    cascade_futures.append(
+                        self._executor.submit(
+                            self._upper_body.detectMultiScale,
+                            gray,
+                            scaleFactor=1.08,
+                            minNeighbors=3,
+                            minSize=(36, 36),
+                        )
+                    )
+
+            total = 0
+            if hog_future is not None:
+                rects, _weights = hog_future.result()
+                total += int(len(rects))
+            for future in cascade_futures:
+                total += int(len(future.result()))
+            return total > 0, total
         except Exception:  # noqa: BLE001
             return False, 0
 
 
-class _Handler(BaseHTTPRequestHandler):
-    state: StreamState
-    stop_event: threading.Event
+_MJPEG_BOUNDARY = "frame"
+_MJPEG_PART_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+_MJPEG_RESPONSE_HEADER = (
+    "HTTP/1.1 200 OK\r\n"
+    "Age: 0\r\n"
+    "Cache-Control: no-cache, private\r\n"
+    "Pragma: no-cache\r\n"
+    f"Content-Type: multipart/x-mixed-replace; boundary={_MJPEG_BOUNDARY}\r\n"
+    "Connection: close\r\n"
+    "\r\n"
+).encode("ascii")
+# The index page never changes, so it is encoded once at import.
+_INDEX_HTML = (
+    "<!doctype html><html><head><meta charset='utf-8'>"
+    "<title>LVA Camera Test</title>"
+    "<style>body{font-family:monospace;background:#111;color:#eee;margin:1rem;}"
+    "img{max-width:100%;border:1px solid #444;}"
+    "pre{background:#1c1c1c;padding:0.75rem;}"
+    "</style></head><body>"
+    "<h2>LVA Camera Detection Test Stream</h2>"
+    "<img src='/stream.mjpg' alt='stream'/>"
+    "<img id='overlay' src='/overlay.jpg' alt='overlay'/>"
+    "<pre id='status'>loading...</pre>"
+    "<script>"
+    "async function tick(){"
+    "const r=await fetch('/status',{cache:'no-store'});"
+    "const j=await r.json();"
+    "document.getElementById('status').textContent=JSON.stringify(j,null,2);"
+    "}"
+    "function overlay(){"
+    "document.getElementById('overlay').src='/overlay.jpg?t='+Date.now();"
+    "}"
+    "setInterval(tick,500);tick();setInterval(overlay,1000);"
+    "</script></body></html>"
+).encode("utf-8")
+
+
+class _StreamServer:
+    """Asyncio HTTP server for the test stream, running its own event loop thread.
+
+    Every viewer is a coroutine on a single loop; MJPEG clients sleep on an
+    ``asyncio.Condition`` and are woken by ``notify_frame`` when the capture
+    loop publishes a new JPEG, so there is no per-viewer thread or polling.
+    """
+
+    def __init__(self, state: StreamState, *, host: str, port: int) -> None:
+        self._state = state
+        self._host = host
+        self._port = port
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.base_events.Server | None = None
+        self._frame_cond: asyncio.Condition | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._start_error: BaseException | None = None
 
-    def do_GET(self) -> None:  # noqa: N802
-        if self.path == "/":
-            self._serve_index()
-            return
-        if self.path == "/status":
-            self._serve_status()
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run,
+            name="lva-test-stream-http",
+            daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._start_error is not None:
+            raise self._start_error
+
+    def stop(self) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def notify_frame(self) -> None:
+        """Wake stream viewers; safe to call from the capture thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
             return
-        if self.path == "/stream.mjpg":
-            self._serve_stream()
+        try:
+            loop.call_soon_threadsafe(self._schedule_notify)
+        except RuntimeError:
+            # Loop closed between the check and the call during shutdown.
+            pass
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        try:
+            loop.run_until_complete(self._start_server())
+        except BaseException as err:  # noqa: BLE001
+            self._start_error = err
+            self._ready.set()
+            loop.close()
             return
-        self.send_error(HTTPStatus.NOT_FOUND, "Not found")
-
-    def log_message(self, format: str, *args: Any) -> None:
-        _LOGGER.debug("http %s - %s", self.address_string(), format % args)
-
-    def _serve_index(self) -> None:
-        body = (
-            "<!doctype html><html><head><meta charset='utf-8'>"
-            "<title>LVA Camera Test</title>"
-            "<style>body{font-family:monospace;background:#111;color:#eee;margin:1rem;}"
-            "img{max-width:100%;border:1px solid #444;}"
-            "pre{background:#1c1c1c;padding:0.75rem;}"
-            "</style></head><body>"
-            "<h2>LVA Camera Detection Test Stream</h2>"
-            "<img src='/stream.mjpg' alt='stream'/><pre id='status'>loading...</pre>"
-            "<script>"
-            "async function tick(){"
-            "const r=await fetch('/status',{cache:'no-store'});"
-            "const j=await r.json();"
-            "document.getElementById('status').textContent=JSON.stringify(j,null,2);"
-            "}"
-            "setInterval(tick,500);tick();"
-            "</script></body></html>"
-        ).encode("utf-8")
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
-
-    def _serve_status(self) -> None:
-        with self.state.lock:
-            payload = json.dumps(self.state.status).encode("utf-8")
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Cache-Control", "no-store")
-        self.send_header("Content-Length", str(len(payload)))
-        self.end_headers()
-        self.wfile.write(payload)
-
-    def _serve_stream(self) -> None:
-        boundary = "frame"
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Age", "0")
-        self.send_header("Cache-Control", "no-cache, private")
-        self.send_header("Pragma", "no-cache")
-        self.send_header(
-            "Content-Type",
-            f"multipart/x-mixed-replace; boundary={boundary}",
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            if self._server is not None:
+                self._server.close()
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    async def _start_server(self) -> None:
+        self._frame_cond = asyncio.Condition()
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            host=self._host,
+            port=self._port,
         )
-        self.end_headers()
 
-        last_seq = -1
-        while not self.stop_event.is_set():
-            with self.state.lock:
-                seq = self.state.frame_seq
-                frame = self.state.frame_jpeg
-            if (not frame) or (seq == last_seq):
-                time.sleep(0.03)
-                continue
-            last_seq = seq
+    def _schedule_notify(self) -> None:
+        asyncio.ensure_future(self._notify_all())
+
+    async def _notify_all(self) -> None:
+        assert self._frame_cond is not None
+        async with self._frame_cond:
+            self._frame_cond.notify_all()
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            if not request_line:
+                return
             try:
-                self.wfile.write(f"--{boundary}\r\n".encode("ascii"))
-                self.wfile.write(b"Content-Type: image/jpeg\r\n")
-                self.wfile.write(
-                    f"Content-Length: {len(frame)}\r\n\r\n".encode("ascii")
+                method, path, _version = (
+                    request_line.decode("iso-8859-1").strip().split(" ", 2)
+                )
+            except ValueError:
+                await self._send(writer, HTTPStatus.BAD_REQUEST, b"Bad request", "text/plain")
+                return
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+            _LOGGER.debug("http %s - %s %s", writer.get_extra_info("peername"), method, path)
+
+            if method != "GET":
+                await self._send(
+                    writer,
+                    HTTPStatus.METHOD_NOT_ALLOWED,
+                    b"Method not allowed",
+                    "text/plain",
                 )
-                self.wfile.write(frame)
-                self.wfile.write(b"\r\n")
-            except (BrokenPipeError, ConnectionResetError):
                 return
+            route = path.split("?", 1)[0]
+            if route == "/":
+                await self._serve_index(writer)
+            elif route == "/status":
+                await self._serve_status(writer)
+            elif route == "/stream.mjpg":
+                await self._serve_stream(writer)
+            elif route == "/overlay.jpg":
+                await self._serve_overlay(writer)
+            else:
+                await self._send(writer, HTTPStatus.NOT_FOUND, b"Not found", "text/plain")
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Server shutdown: let open viewers end quietly.
+            pass
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("http request failed", exc_info=True)
+        finally:
+            writer.close()
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+        *,
+        extra_headers: tuple[str, ...] = (),
+    ) -> None:
+        headers = [
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n",
+            f"Content-Type: {content_type}\r\n",
+            f"Content-Length: {len(body)}\r\n",
+            *(f"{header}\r\n" for header in extra_headers),
+            "Connection: close\r\n",
+            "\r\n",
+        ]
+        writer.writelines(("".join(headers).encode("ascii"), body))
+        await writer.drain()
+
+    async def _serve_index(self, writer: asyncio.StreamWriter) -> None:
+        await self._send(writer, HTTPStatus.OK, _INDEX_HTML, "text/html; charset=utf-8")
+
+    async def _serve_status(self, writer: asyncio.StreamWriter) -> None:
+        payload = json.dumps(self._state.current.status).encode("utf-8")
+        await self._send(
+            writer,
+            HTTPStatus.OK,
+            payload,
+            "application/json",
+            extra_headers=("Cache-Control: no-store",),
+        )
+
+    async def _serve_overlay(self, writer: asyncio.StreamWriter) -> None:
+        body = self._state.current.overlay_jpeg
+        if not body:
+            await self._send(
+                writer,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                b"No frame yet",
+                "text/plain",
+            )
+            return
+        await self._send(
+            writer,
+            HTTPStatus.OK,
+            body,
+            "image/jpeg",
+            extra_headers=("Cache-Control: no-store",),
+        )
+
+    async def _serve_stream(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(_MJPEG_RESPONSE_HEADER)
+        await writer.drain()
+
+        cond = self._frame_cond
+        assert cond is not None
+        state = self._state
+        last_seq = -1
+        while True:
+            async with cond:
+                await cond.wait_for(
+                    lambda: bool(state.current.frame_jpeg)
+                    and (state.current.frame_seq != last_seq)
+                )
+            snapshot = state.current
+            last_seq = snapshot.frame_seq
+            frame = snapshot.frame_jpeg
+            writer.writelines((_MJPEG_PART_HEADER % len(frame), frame, b"\r\n"))
+            await writer.drain()
 
 
 def _build_overlay_lines(status: dict[str, Any]) -> list[str]:
@@ -342,7 +638,73 @@ def _build_overlay_lines(status: dict[str, Any]) -> list[str]:
     ]
 
 
+class _SockaddrIn(ctypes.Structure):
+    # Linux layout; BSD/macOS prepend an sa_len byte.
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+    ]
+
+
+class _Ifaddrs(ctypes.Structure):
+    # ifa_next is untyped here (the class cannot name itself yet); the walk casts it.
+    _fields_ = [
+        ("ifa_next", ctypes.c_void_p),
+        ("ifa_name", ctypes.c_char_p),
+        ("ifa_flags", ctypes.c_uint),
+        ("ifa_addr", ctypes.POINTER(_SockaddrIn)),
+        ("ifa_netmask", ctypes.c_void_p),
+        ("ifa_ifu", ctypes.c_void_p),
+        ("ifa_data", ctypes.c_void_p),
+    ]
+
+
+_IFF_UP = 0x1
+
+
+def _getifaddrs_ipv4() -> list[str] | None:
+    """IPv4 addresses of the up interfaces from one getifaddrs(3) call.
+
+    Returns None where the ctypes walk is not available (non-Linux, no libc),
+    so the caller can fall back to resolver/socket probing.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        getifaddrs = libc.getifaddrs
+        freeifaddrs = libc.freeifaddrs
+    except (OSError, AttributeError):
+        return None
+    getifaddrs.argtypes = [ctypes.POINTER(ctypes.POINTER(_Ifaddrs))]
+    freeifaddrs.argtypes = [ctypes.POINTER(_Ifaddrs)]
+    freeifaddrs.restype = None
+
+    head = ctypes.POINTER(_Ifaddrs)()
+    if getifaddrs(ctypes.byref(head)) != 0:
+        return None
+    ips: set[str] = set()
+    try:
+        node = head
+        while node:
+            entry = node.contents
+            addr = entry.ifa_addr
+            if addr and (entry.ifa_flags & _IFF_UP) and addr.contents.sin_family == socket.AF_INET:
+                ip = socket.inet_ntoa(bytes(addr.contents.sin_addr))
+                if not ip.startswith("127."):
+                    ips.add(ip)
+            node = ctypes.cast(entry.ifa_next, ctypes.POINTER(_Ifaddrs))
+    finally:
+        freeifaddrs(head)
+    return sorted(ips)
+
+
 def _detect_local_ips() -> list[str]:
+    local_ips = _getifaddrs_ipv4()
+    if local_ips is not None:
+        return local_ips
+
     ips: set[str] = set()
     try:
         infos = socket.getaddrinfo(
@@ -370,6 +732,15 @@ def _detect_local_ips() -> list[str]:
     return sorted(ips)
 
 
+def _log_local_urls() -> None:
+    local_ips = _detect_local_ips()
+    if local_ips:
+        _LOGGER.info(
+            "Accesso da altri device: %s",
+            ", ".join(f"http://{ip}:{STREAM_PORT}" for ip in local_ips),
+        )
+
+
 def _retune_adaptive(
     *,
     ema_processing_ms: float,
@@ -386,7 +757,11 @@ def _retune_adaptive(
     if ema_processing_ms <= 0.0:
         return effective_fps, window_size
 
-    max_sustainable_fps = max(1.0, 1000.0 / ema_processing_ms)
+    # Plain scalar locals: this runs once per frame, so the casts and the
+    # headroom product are done once instead of at every use.
+    target = float(target_fps)
+    ceiling = float(max_fps)
+    sustainable = max(1.0, 1000.0 / ema_processing_ms) * 0.9
     cpu_load = max(0.0, min(2.0, float(cpu_load_ratio)))
     if cpu_load <= 0.45:
         cpu_floor_fps = 2.5
@@ -395,20 +770,19 @@ def _retune_adaptive(
     else:
         cpu_floor_fps = 1.0
 
-    desired_fps = min(float(max_fps), max_sustainable_fps * 0.9)
-    desired_fps = max(float(target_fps), desired_fps, cpu_floor_fps)
+    desired_fps = max(target, min(ceiling, sustainable), cpu_floor_fps)
     if reaction_boost:
         desired_fps = min(
-            max(2.0, float(target_fps) * 3.0, cpu_floor_fps + 0.8),
-            max_sustainable_fps * 0.9,
-            float(max_fps),
+            max(2.0, target * 3.0, cpu_floor_fps + 0.8),
+            sustainable,
+            ceiling,
         )
     if uncertain_streak >= 2:
-        desired_fps = max(desired_fps, min(float(max_fps), cpu_floor_fps + 0.6))
+        desired_fps = max(desired_fps, min(ceiling, cpu_floor_fps + 0.6))
     if stable_streak >= 3:
-        desired_fps = max(float(target_fps), desired_fps - 0.25)
+        desired_fps = max(target, desired_fps - 0.25)
     next_effective_fps = (effective_fps * 0.75) + (desired_fps * 0.25)
-    next_effective_fps = max(float(target_fps), min(float(max_fps), next_effective_fps))
+    next_effective_fps = max(target, min(ceiling, next_effective_fps))
 
     next_window = window_size
     if uncertain_streak >= 2 and window_size < window_max:
@@ -418,19 +792,46 @@ def _retune_adaptive(
     return next_effective_fps, next_window
 
 
+_CPU_COUNT = max(1, int(os.cpu_count() or 1))
+
+
 def _cpu_load_ratio() -> float:
-    cpu_count = max(1, int(os.cpu_count() or 1))
     try:
         one_min_load = float(os.getloadavg()[0])
     except Exception:  # noqa: BLE001
         return 0.0
-    return max(0.0, one_min_load / float(cpu_count))
+    return max(0.0, one_min_load / float(_CPU_COUNT))
+
+
+def _file_stat_key(path: str | os.PathLike[str]) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# Last parsed settings plus the config/preferences stat keys they came from.
+_vision_settings_cache: dict[str, Any] = {}
 
 
 def _load_vision_settings() -> VisionSettings:
+    """Load vision settings, re-parsing only when config or preferences changed."""
+    config_key = _file_stat_key(get_config_path())
+    cached = _vision_settings_cache.get("settings")
+    if (
+        cached is not None
+        and config_key is not None
+        and config_key == _vision_settings_cache.get("config_key")
+        and _file_stat_key(_vision_settings_cache["preferences_path"])
+        == _vision_settings_cache.get("preferences_key")
+    ):
+        return cached
+
     app_config = load_config()
     core = app_config.core
     preferences_path = resolve_repo_path(core.preferences_file)
+    preferences_key = _file_stat_key(preferences_path)
     preferences: dict[str, Any] = {}
     try:
         with open(preferences_path, "r", encoding="utf-8") as pref_file:
@@ -453,11 +854,35 @@ def _load_vision_settings() -> VisionSettings:
         if (core.vision_min_confidence is None)
         else _clamp_confidence(core.vision_min_confidence)
     )
-    return VisionSettings(
+    settings = VisionSettings(
         vision_enabled=vision_enabled,
         attention_required=attention_required,
         min_confidence=min_confidence,
     )
+    _vision_settings_cache.update(
+        settings=settings,
+        config_key=config_key,
+        preferences_path=preferences_path,
+        preferences_key=preferences_key,
+    )
+    return settings
+
+
+def _enable_opencl(cv2: Any) -> bool:
+    """Route UMat inputs through OpenCV's OpenCL backend when a device exists."""
+    try:
+        cv2.setUseOptimized(True)
+        if not cv2.ocl.haveOpenCL():
+            return False
+        cv2.ocl.setUseOpenCL(True)
+        return bool(cv2.ocl.useOpenCL())
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _to_umat(cv2: Any, image: np.ndarray) -> Any:
+    """Upload a frame for the OpenCL path (cv2's stubs omit the ndarray overload)."""
+    return cv2.UMat(image)
 
 
 def _would_trigger_service_logic(
@@ -490,13 +915,28 @@ def run(args: argparse.Namespace) -> None:
     fps = 1.0
     max_adaptive_fps = 4.0
     jpeg_quality = 80
+    # Baseline, non-optimized JPEG: skip the extra Huffman-optimization pass.
+    jpeg_params = [
+        int(cv2.IMWRITE_JPEG_QUALITY),
+        jpeg_quality,
+        int(cv2.IMWRITE_JPEG_OPTIMIZE),
+        0,
+        int(cv2.IMWRITE_JPEG_PROGRESSIVE),
+        0,
+    ]
     selected_backend = "auto"
 
     detector = SimpleFaceGlanceDetector()
     cascade = getattr(detector, "_cascade", None)
     if cascade is None:
         raise RuntimeError("face_cascade_unavailable")
-    person_detector = _PersonDetector()
+    detect_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lva-test-stream-detect")
+    person_detector = _PersonDetector(detect_pool)
+    # Without an OpenCL device (the common case on a Pi) UMat only adds copies,
+    # so detector inputs stay plain arrays unless the backend is really usable.
+    use_opencl = _enable_opencl(cv2)
+    if use_opencl:
+        _LOGGER.info("OpenCL attivo per cascade/HOG")
 
     cap = None
     # Match visd behavior: prefer OpenCV capture first, then fallback.
@@ -526,8 +966,9 @@ def run(args: argparse.Namespace) -> None:
     led_sync = _DirectLedSync()
     led_sync.update(ok=False, has_error=False)
 
-    state = StreamState(
-        status={
+    state = StreamState()
+    state.publish(
+        {
             "state": "BOOTING",
             "confidence": 0.0,
             "face_count": 0,
@@ -544,26 +985,18 @@ def run(args: argparse.Namespace) -> None:
     )
     stop_event = threading.Event()
 
-    handler_type = type(
-        "LvaTestStreamHandler",
-        (_Handler,),
-        {"state": state, "stop_event": stop_event},
-    )
-    server = ThreadingHTTPServer((STREAM_HOST, STREAM_PORT), handler_type)
-    threading.Thread(
-        target=server.serve_forever,
-        name="lva-test-stream-http",
-        daemon=True,
-    ).start()
+    server = _StreamServer(state, host=STREAM_HOST, port=STREAM_PORT)
+    server.start()
 
     _LOGGER.info("Test stream pronto: http://%s:%s", STREAM_HOST, STREAM_PORT)
     if STREAM_HOST in {"0.0.0.0", "::"}:
-        local_ips = _detect_local_ips()
-        if local_ips:
-            _LOGGER.info(
-                "Accesso da altri device: %s",
-                ", ".join(f"http://{ip}:{STREAM_PORT}" for ip in local_ips),
-            )
+        # DNS lookups can stall for seconds on a misconfigured network; the
+        # addresses are informational only, so never hold up the first frame.
+        threading.Thread(
+            target=_log_local_urls,
+            name="lva-test-stream-ips",
+            daemon=True,
+        ).start()
 
     recent_frames: deque[Any] = deque(maxlen=frame_count)
     effective_fps = fps
@@ -578,11 +1011,22 @@ def run(args: argparse.Namespace) -> None:
     settings_reload_at = 0.0
     frame_window_started = time.monotonic()
     frame_window_count = 0
+    person_cached: tuple[bool, int] = (False, 0)
+    person_frames_since = 0
+    person_stale = True
+    overlay_encode_at = 0.0
+    gate_tiny: np.ndarray | None = None
+    gate_analyzed_at = 0.0
+    gate_result: tuple[Any, Any, bool, int] | None = None
+    # 1/effective_fps as an integer, refreshed only when the rate is retuned.
+    interval_fps = 0.0
+    frame_interval_ns = 0
 
     try:
         while not stop_event.is_set():
-            frame_started = time.monotonic()
-            now = time.monotonic()
+            # One clock read per phase; the ns counter keeps the timing math in ints.
+            frame_started_ns = time.monotonic_ns()
+            now = frame_started_ns / 1e9
             if now >= settings_reload_at:
                 settings_reload_at = now + 1.0
                 try:
@@ -591,6 +1035,7 @@ def run(args: argparse.Namespace) -> None:
                 except Exception:  # noqa: BLE001
                     pass
             frame = None
+            camera_jpeg = None
             if active_backend == "opencv" and cap is not None:
                 ok, frame = cap.read()
                 if ok and frame is not None:
@@ -615,64 +1060,124 @@ def run(args: argparse.Namespace) -> None:
                     )
                     if decoded is not None:
                         frame = decoded
+                        camera_jpeg = jpg
 
             if frame is None:
                 now = time.monotonic()
                 if (now - last_good_frame_at) > 1.2:
                     led_sync.update(ok=False, has_error=True)
-                    with state.lock:
-                        state.status = {
-                            **state.status,
+                    state.publish(
+                        {
+                            **state.current.status,
                             "state": "ERROR",
                             "error": "camera_stalled",
                             "capture_backend": active_backend,
                         }
+                    )
                 time.sleep(0.02)
                 continue
-            last_good_frame_at = time.monotonic()
-
-            detection_frame = cv2.resize(
-                frame,
-                (DETECTION_WIDTH, DETECTION_HEIGHT),
-                interpolation=cv2.INTER_AREA,
-            )
-            recent_frames.append(detection_frame)
-            frames_for_detection = list(recent_frames)[-analysis_window:]
-            detection = detector.analyze(frames_for_detection)
-
-            gray = cv2.cvtColor(detection_frame, cv2.COLOR_BGR2GRAY)
-            faces = cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.15,
-                minNeighbors=3,
-                minSize=(28, 28),
-            )
-            sx = float(frame.shape[1]) / float(DETECTION_WIDTH)
-            sy = float(frame.shape[0]) / float(DETECTION_HEIGHT)
-            for (x, y, fw, fh) in faces:
-                x0 = int(round(x * sx))
-                y0 = int(round(y * sy))
-                x1 = int(round((x + fw) * sx))
-                y1 = int(round((y + fh) * sy))
-                cv2.rectangle(frame, (x0, y0), (x1, y1), (0, 255, 0), 2)
-
+            captured_at = time.monotonic()
+            last_good_frame_at = captured_at
+
+            # Convert first and downscale the single gray channel: a third of the
+            # memory traffic of resizing BGR, and linear filtering is plenty for
+            # Haar/HOG input. The gray frame is shared by every cascade pass.
+            # The default capture size already is the detection size; then the
+            # resizes would be plain copies and are skipped.
+            native_size = frame.shape[:2] == (DETECTION_HEIGHT, DETECTION_WIDTH)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if not native_size:
+                gray = cv2.resize(
+                    gray,
+                    (DETECTION_WIDTH, DETECTION_HEIGHT),
+                    interpolation=cv2.INTER_LINEAR,
+                )
+            recent_frames.append(gray)
+            # Change gate: compare a thumbnail with the last analyzed frame and
+            # reuse its results while the scene stays put. Comparing against the
+            # analyzed frame (not the previous one) lets slow drift add up.
+            tiny = cv2.resize(gray, SCENE_GATE_SIZE, interpolation=cv2.INTER_AREA)
+            cached_result = None
+            if (
+                (gate_result is not None)
+                and (gate_tiny is not None)
+                and ((captured_at - gate_analyzed_at) < SCENE_STATIC_MAX_S)
+                and (float(cv2.absdiff(tiny, gate_tiny).mean()) < SCENE_CHANGE_THRESHOLD)
+            ):
+                cached_result = gate_result
+            scene_static = cached_result is not None
+            if cached_result is not None:
+                detection, faces, has_person, person_count = cached_result
+                face_detected = int(len(faces)) > 0
+            else:
+                # Index the tail directly instead of copying the whole deque to slice it.
+                window = min(analysis_window, len(recent_frames))
+                frames_for_detection = [recent_frames[i] for i in range(-window, 0)]
+                detection = detector.analyze(frames_for_detection)
+
+                gray_input = _to_umat(cv2, gray) if use_opencl else gray
+                faces = cascade.detectMultiScale(
+                    gray_input,
+                    scaleFactor=1.15,
+                    minNeighbors=3,
+                    minSize=(28, 28),
+                    maxSize=(DETECTION_MAX_OBJECT, DETECTION_MAX_OBJECT),
+                )
+                face_detected = int(len(faces)) > 0
+                # A detected face already proves a person is present, so the far
+                # costlier HOG/profile/upper-body passes only run without one.
+                if face_detected:
+                    has_person, person_count = True, int(len(faces))
+                    # Re-check from scratch once the face is gone.
+                    person_stale = True
+                else:
+                    # Presence changes on a sub-second scale: refresh the person
+                    # result roughly every 0.75s of frames and reuse it in between.
+                    person_stride = max(1, int(round(effective_fps * 0.75)))
+                    if person_stale or (person_frames_since >= person_stride):
+                        # HOG still wants color input; only resize BGR when it runs.
+                        detection_frame = frame
+                        if not native_size:
+                            detection_frame = cv2.resize(
+                                frame,
+                                (DETECTION_WIDTH, DETECTION_HEIGHT),
+                                interpolation=cv2.INTER_LINEAR,
+                            )
+                        if use_opencl:
+                            # HOG's internal resize may still run on the CPU.
+                            detection_frame = _to_umat(cv2, detection_frame)
+                        mirrored = cv2.flip(gray_input, 1)
+                        person_cached = person_detector.detect(
+                            detection_frame,
+                            gray_input,
+                            mirrored,
+                            fast=ema_processing_ms > HOG_FAST_PROCESSING_MS,
+                        )
+                        person_frames_since = 0
+                        person_stale = False
+                    person_frames_since += 1
+                    has_person, person_count = person_cached
+                gate_tiny = tiny
+                gate_analyzed_at = captured_at
+                gate_result = (detection, faces, has_person, person_count)
             frame_window_count += 1
-            elapsed = max(0.001, time.monotonic() - frame_window_started)
+            elapsed = max(0.001, captured_at - frame_window_started)
             if elapsed >= 1.0:
                 current_fps = frame_window_count / elapsed
                 frame_window_count = 0
-                frame_window_started = time.monotonic()
+                frame_window_started = captured_at
             else:
-                current_fps = float(state.status.get("fps", 0.0))
+                current_fps = float(state.current.status.get("fps", 0.0))
 
+            confidence = _clamp_confidence(detection.confidence)
             accepted = _would_trigger_service_logic(
                 state=str(detection.state),
-                confidence=_clamp_confidence(detection.confidence),
+                confidence=confidence,
                 settings=vision_settings,
             )
             status_payload = {
                 "state": detection.state,
-                "confidence": _clamp_confidence(detection.confidence),
+                "confidence": confidence,
                 "face_count": int(len(faces)),
                 "fps": current_fps,
                 "ok": accepted,
@@ -684,19 +1189,13 @@ def run(args: argparse.Namespace) -> None:
                 "capture_backend": active_backend,
                 "timestamp": time.time(),
             }
-            has_person, person_count = person_detector.detect(detection_frame)
-            face_detected = int(len(faces)) > 0
-            # Practical fallback: if a face is detected, a person is present.
-            if face_detected and (not has_person):
-                has_person = True
-                person_count = max(1, int(person_count))
             looking_toward = detection.state == "FACE_TOWARD"
             status_payload["person_detected"] = has_person
             status_payload["person_count"] = person_count
             status_payload["face_detected"] = face_detected
             status_payload["looking_toward_camera"] = looking_toward
-            confidence = float(status_payload["confidence"])
-            is_ok = bool(status_payload["ok"])
+            status_payload["scene_static"] = scene_static
+            is_ok = accepted
             is_uncertain = (
                 (status_payload["state"] == "FACE_AWAY")
                 or (abs(confidence - min_conf) < 0.12)
@@ -712,17 +1211,20 @@ def run(args: argparse.Namespace) -> None:
                 uncertain_streak = 0
                 stable_streak = 0
 
-            processing_ms = max(0.1, (time.monotonic() - frame_started) * 1000.0)
+            processed_ns = time.monotonic_ns()
+            processing_ms = max(0.1, (processed_ns - frame_started_ns) / 1_000_000)
             if ema_processing_ms <= 0.0:
                 ema_processing_ms = processing_ms
             else:
                 ema_processing_ms = (ema_processing_ms * 0.8) + (processing_ms * 0.2)
-            now = time.monotonic()
+            now = processed_ns / 1e9
             if now >= cpu_sample_at:
                 cpu_sample_at = now + 0.6
                 cpu_now = _cpu_load_ratio()
                 cpu_ema = (cpu_ema * 0.8) + (cpu_now * 0.2)
             state_changed = str(status_payload["state"]) != last_state
+            if state_changed:
+                person_stale = True
             reaction_boost = is_uncertain or state_changed
             effective_fps, analysis_window = _retune_adaptive(
                 ema_processing_ms=ema_processing_ms,
@@ -743,46 +1245,65 @@ def run(args: argparse.Namespace) -> None:
             status_payload["effective_fps"] = effective_fps
             status_payload["cpu_load_ratio"] = cpu_ema
             led_sync.update(ok=bool(status_payload["ok"]), has_error=False)
-            color = (0, 255, 0) if status_payload["ok"] else (0, 165, 255)
-            for idx, line in enumerate(_build_overlay_lines(status_payload)):
-                y = 20 + (idx * 20)
-                cv2.putText(
-                    frame,
-                    line,
-                    (12, y),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.52,
-                    color,
-                    1,
-                    cv2.LINE_AA,
+            # rpicam already delivers hardware-encoded JPEGs: stream those as-is
+            # and only re-encode the annotated overlay about once per second.
+            draw_overlay = (camera_jpeg is None) or (now >= overlay_encode_at)
+            overlay_jpeg = None
+            if draw_overlay:
+                # Boxes only matter on frames that get encoded; passthrough
+                # frames between overlay refreshes are never annotated.
+                sx = float(frame.shape[1]) / float(DETECTION_WIDTH)
+                sy = float(frame.shape[0]) / float(DETECTION_HEIGHT)
+                for (x, y, fw, fh) in faces:
+                    x0 = int(round(x * sx))
+                    y0 = int(round(y * sy))
+                    x1 = int(round((x + fw) * sx))
+                    y1 = int(round((y + fh) * sy))
+                    cv2.rectangle(frame, (x0, y0), (x1, y1), (0, 255, 0), 2)
+                color = (0, 255, 0) if status_payload["ok"] else (0, 165, 255)
+                # Rasterize directly: putText costs ~13us per line, while blending
+                # a cached antialiased line mask through numpy measured 4-8x slower.
+                for idx, line in enumerate(_build_overlay_lines(status_payload)):
+                    y = 20 + (idx * 20)
+                    cv2.putText(
+                        frame,
+                        line,
+                        (12, y),
+                        cv2.FONT_HERSHEY_SIMPLEX,
+                        0.52,
+                        color,
+                        1,
+                        cv2.LINE_AA,
+                    )
+                ok_jpeg, encoded = cv2.imencode(".jpg", frame, jpeg_params)
+                if ok_jpeg:
+                    overlay_jpeg = encoded.tobytes()
+                    overlay_encode_at = now + OVERLAY_INTERVAL_S
+
+            stream_jpeg = camera_jpeg if camera_jpeg is not None else overlay_jpeg
+            if stream_jpeg is not None:
+                state.publish(
+                    status_payload,
+                    frame_jpeg=stream_jpeg,
+                    overlay_jpeg=overlay_jpeg,
                 )
-
-            ok_jpeg, encoded = cv2.imencode(
-                ".jpg",
-                frame,
-                [int(cv2.IMWRITE_JPEG_QUALITY), jpeg_quality],
-            )
-            if ok_jpeg:
-                with state.lock:
-                    state.frame_seq += 1
-                    state.frame_jpeg = bytes(encoded.tobytes())
-                    state.status = status_payload
-
-            to_sleep = max(
-                0.0,
-                (1.0 / effective_fps) - (time.monotonic() - frame_started),
-            )
-            if to_sleep > 0:
-                time.sleep(to_sleep)
+                server.notify_frame()
+
+            if effective_fps != interval_fps:
+                interval_fps = effective_fps
+                frame_interval_ns = int(1e9 / effective_fps)
+            to_sleep_ns = frame_interval_ns - (time.monotonic_ns() - frame_started_ns)
+            if to_sleep_ns > 0:
+                time.sleep(to_sleep_ns / 1e9)
     except KeyboardInterrupt:
         _LOGGER.info("Interrotto da tastiera")
     finally:
         stop_event.set()
-        server.shutdown()
-        server.server_close()
+        server.stop()
         if cap is not None:
             cap.release()
         rpicam_source.stop()
+        detect_pool.shutdown(wait=True)
         led_sync.close()
 
 
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from ._i2c_bus import get_i2c
+from .distance_reader import DistanceSmoother, property_getter
 
 _LOGGER = logging.getLogger(__name__)
 # For long-range operation we avoid compressing far-end values with calibration
 # and increase sensitivity via slower/high-budget measurements.
 VL53L0X_CAL_SCALE = 1.0
 VL53L0X_CAL_OFFSET_MM = 0.0
+# Decided once at import: the default calibration is a no-op per sample.
+_CAL_IS_IDENTITY = (VL53L0X_CAL_SCALE == 1.0) and (VL53L0X_CAL_OFFSET_MM == 0.0)
 VL53L0X_LONG_RANGE_SIGNAL_RATE_LIMIT_MCPS = 0.05
 VL53L0X_LONG_RANGE_TIMING_BUDGET_MS = 330
+# The driver reports ~8191mm when the target is out of range.
+VL53L0X_OUT_OF_RANGE_MM = 8190
 
 
 class Vl53l0xReader:
@@ -20,10 +28,16 @@ class Vl53l0xReader:
     Uses Adafruit driver when available.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, window: int = 5, use_median: bool = False) -> None:
         self._sensor = None
+        self._smoother = DistanceSmoother(window, use_median=use_median)
+        # Both slots stay on the stub until the sensor initializes; there is
+        # no reinit, so polling a missing sensor never re-checks availability.
+        self._read_range: Callable[[], Any] = self._read_unavailable
+        self._read_impl: Callable[[], Optional[float]] = self._read_unavailable
         self._available = False
-        self._last_read_error: Optional[str] = None
+        # (exception type, args) of the last logged read failure.
+        self._last_read_error: Optional[tuple[type, tuple]] = None
         self._init_sensor()
 
     @property
@@ -32,17 +46,16 @@ class Vl53l0xReader:
 
     def _init_sensor(self) -> None:
         try:
-            import board  # type: ignore
-            import busio  # type: ignore
             import adafruit_vl53l0x  # type: ignore
 
-            i2c = busio.I2C(board.SCL, board.SDA)
-            sensor = adafruit_vl53l0x.VL53L0X(i2c)
+            sensor = adafruit_vl53l0x.VL53L0X(get_i2c())
             # Long-range profile: favor sensitivity over speed to improve
             # reliability around ~2m on reflective targets.
             sensor.signal_rate_limit = VL53L0X_LONG_RANGE_SIGNAL_RATE_LIMIT_MCPS
             sensor.measurement_timing_budget = int(VL53L0X_LONG_RANGE_TIMING_BUDGET_MS * 1000)
             self._sensor = sensor
+            self._read_range = property_getter(sensor, "range")
+            self._read_impl = self._read_distance
             self._available = True
             _LOGGER.info(
                 "VL53L0X reader initialized (long-range: signal_rate_limit=%.2f MCPS, timing_budget=%sms)",
@@ -55,29 +68,53 @@ class Vl53l0xReader:
 
         self._available = False
         self._sensor = None
+        self._read_range = self._read_unavailable
+        self._read_impl = self._read_unavailable
+
+    @staticmethod
+    def _read_unavailable() -> Optional[float]:
+        return None
 
     def read_distance_mm(self) -> Optional[float]:
-        if (not self._available) or (self._sensor is None):
-            return None
+        value = self._read_impl()
+        self._smoother.add(value)
+        return value
 
+    def latest_smoothed_mm(self) -> Optional[float]:
+        """Smoothed distance over the last ``window`` reads, or None until stable."""
+        return self._smoother.value()
+
+    def _read_distance(self) -> Optional[float]:
         try:
-            value = float(self._sensor.range)
+            value = self._read_range()
         except Exception as err:  # noqa: BLE001
-            err_text = str(err)
-            if err_text != self._last_read_error:
+            # Compare type/args instead of formatting str(err) on every miss.
+            err_key = (type(err), err.args)
+            if err_key != self._last_read_error:
                 _LOGGER.warning("VL53L0X read failed: %s", err)
-                self._last_read_error = err_text
+                self._last_read_error = err_key
             return None
 
         self._last_read_error = None
-        # VL53L0X commonly returns ~8191mm when target is out of range.
-        if (value <= 0.0) or (value >= 8190.0):
+        # ``range`` is an int in mm; gate it before any float math.
+        if (value <= 0) or (value >= VL53L0X_OUT_OF_RANGE_MM):
             return None
+        if _CAL_IS_IDENTITY:
+            return float(value)
         corrected = (value * VL53L0X_CAL_SCALE) + VL53L0X_CAL_OFFSET_MM
         if corrected <= 0.0:
             return None
         return corrected
 
+    async def read_distance_mm_async(self) -> Optional[float]:
+        """``read_distance_mm`` in a worker thread.
+
+        A single-shot reading blocks for the whole timing budget (330ms in the
+        long-range profile), which must not stall the event loop. Synchronous
+        callers keep using ``read_distance_mm``.
+        """
+        return await asyncio.to_thread(self.read_distance_mm)
+
     def read_mm(self) -> Optional[float]:
         """Compatibility alias used by the distance activation logic."""
         return self.read_distance_mm()
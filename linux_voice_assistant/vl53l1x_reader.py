@@ -2,24 +2,153 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from ._i2c_bus import get_i2c
+from .distance_reader import DistanceSmoother, property_getter
+
+try:
+    from gpiozero import DigitalInputDevice  # type: ignore
+except Exception:  # noqa: BLE001
+    DigitalInputDevice = None  # type: ignore[assignment]
+
+try:
+    from smbus2 import SMBus, i2c_msg  # type: ignore
+except Exception:  # noqa: BLE001
+    SMBus = None  # type: ignore[assignment,misc]
+    i2c_msg = None  # type: ignore[assignment,misc]
 
 _LOGGER = logging.getLogger(__name__)
-VL53L1X_MAX_MM = 4000.0
+VL53L1X_MAX_MM = 4000
+VL53L1X_I2C_BUS = 1
+VL53L1X_I2C_ADDRESS = 0x29
+# Upper bound for the doubling reinit cooldown while the sensor stays down.
+VL53L1X_REINIT_MAX_COOLDOWN_S = 60.0
+# Pause between data-ready polls, about one sensor integration step.
+VL53L1X_POLL_INTERVAL_S = 0.002
+# Read deadlines missed in a row on the GPIO interrupt before it is abandoned
+# (wrong pin or wiring) in favor of polling data-ready over I2C.
+VL53L1X_INT_TIMEOUT_LIMIT = 3
+
+# VL53L1X registers (16-bit addresses, sent big-endian).
+_REG_GPIO_HV_MUX_CTRL = 0x0030
+_REG_GPIO_TIO_HV_STATUS = 0x0031
+_REG_SYSTEM_INTERRUPT_CLEAR = 0x0086
+_REG_RESULT_RANGE_STATUS = 0x0089
+_REG_RESULT_RANGE_MM_SD0 = 0x0096
+# One read from RESULT__RANGE_STATUS covers the status byte and the range.
+_RESULT_BLOCK_LEN = 17
+_RESULT_RANGE_OFFSET = _REG_RESULT_RANGE_MM_SD0 - _REG_RESULT_RANGE_STATUS
+_RANGE_STATUS_VALID = 0x09
+_RESULT_BLOCK_ADDR = _REG_RESULT_RANGE_STATUS.to_bytes(2, "big")
+_INTERRUPT_CLEAR_CMD = _REG_SYSTEM_INTERRUPT_CLEAR.to_bytes(2, "big") + b"\x01"
+
+
+class _RawVl53l1x:
+    """Direct smbus2 access to the VL53L1X result registers.
+
+    The Adafruit driver spends two I2C transactions on ``data_ready`` (it
+    re-reads the interrupt polarity every time), two on ``distance`` and one
+    on ``clear_interrupt``. Here ``data_ready`` is one write-then-read and
+    ``read_and_clear`` fetches the result block and clears the interrupt in a
+    single ``i2c_rdwr``. Sensor setup stays with the driver.
+
+    The ``i2c_msg`` structs for both polls are built once and reused: each
+    ioctl refills the read buffers in place, so a poll no longer rebuilds
+    the ctypes message structs.
+    """
+
+    def __init__(self, bus: Any, address: int = VL53L1X_I2C_ADDRESS) -> None:
+        self._bus = bus
+        self._address = address
+        polarity = self._read(_REG_GPIO_HV_MUX_CTRL, 1)[0]
+        # GPIO1 level (and TIO_HV_STATUS bit) that signals a ready result.
+        self.ready_level = 0 if (polarity & 0x10) else 1
+        self._status_msgs = (
+            i2c_msg.write(address, _REG_GPIO_TIO_HV_STATUS.to_bytes(2, "big")),
+            i2c_msg.read(address, 1),
+        )
+        self._result_block = i2c_msg.read(address, _RESULT_BLOCK_LEN)
+        self._result_msgs = (
+            i2c_msg.write(address, _RESULT_BLOCK_ADDR),
+            self._result_block,
+            i2c_msg.write(address, _INTERRUPT_CLEAR_CMD),
+        )
+
+    def _read(self, register: int, length: int) -> bytes:
+        write = i2c_msg.write(self._address, register.to_bytes(2, "big"))
+        read = i2c_msg.read(self._address, length)
+        self._bus.i2c_rdwr(write, read)
+        return bytes(read)
+
+    def data_ready(self) -> bool:
+        msgs = self._status_msgs
+        self._bus.i2c_rdwr(*msgs)
+        return (bytes(msgs[1])[0] & 0x01) == self.ready_level
+
+    def read_and_clear(self) -> Optional[int]:
+        """Consume a ready result; range in whole millimeters as the sensor
+        reports it, None when the range status is invalid."""
+        self._bus.i2c_rdwr(*self._result_msgs)
+        result = bytes(self._result_block)
+        if result[0] != _RANGE_STATUS_VALID:
+            return None
+        return int.from_bytes(result[_RESULT_RANGE_OFFSET:_RESULT_RANGE_OFFSET + 2], "big")
+
+    def close(self) -> None:
+        self._bus.close()
+
+
+def _driver_distance_mm(distance_cm: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap the Adafruit ``distance`` getter (centimeters) to return millimeters."""
+
+    def read_mm() -> Any:
+        value_cm = distance_cm()
+        if value_cm is None:
+            return None
+        return value_cm * 10
+
+    return read_mm
 
 
 class Vl53l1xReader:
     """Read distance from a VL53L1X over I2C."""
 
-    def __init__(self, *, max_read_retries: int = 2, reinit_cooldown_s: float = 1.0) -> None:
+    def __init__(
+        self,
+        *,
+        read_deadline_s: float = 0.05,
+        reinit_cooldown_s: float = 1.0,
+        gpio_int_pin: Optional[int] = None,
+        raw_i2c: bool = False,
+        window: int = 5,
+        use_median: bool = False,
+    ) -> None:
         self._sensor = None
+        self._smoother = DistanceSmoother(window, use_median=use_median)
+        self._raw_i2c = raw_i2c
+        self._raw: Optional[_RawVl53l1x] = None
+        self._gpio_int_pin = gpio_int_pin
+        self._int_input = None
+        self._int_ready_level: Optional[int] = None
+        self._int_timeouts = 0
+        # Stubs until the sensor initializes, so the poll path never sees None.
+        self._data_ready: Callable[[], Any] = self._not_ready
+        # I2C data-ready check, kept for when the interrupt pin is abandoned.
+        self._polled_ready: Callable[[], Any] = self._not_ready
+        # Range in mm (None when invalid) from whichever read path is active.
+        self._distance: Callable[[], Any] = self._no_distance
+        self._clear_interrupt: Optional[Callable[[], Any]] = None
         self._available = False
-        self._last_error: Optional[str] = None
-        self._max_read_retries = max(0, int(max_read_retries))
+        # (exception type, args) of the last logged init/read failure.
+        self._last_error: Optional[tuple[type, tuple]] = None
+        self._read_deadline_s = max(0.0, float(read_deadline_s))
         self._reinit_cooldown_s = max(0.1, float(reinit_cooldown_s))
         self._last_reinit_at = 0.0
+        self._reinit_fail_count = 0
         self._i2c = None
         self._init_sensor()
 
@@ -29,11 +158,9 @@ class Vl53l1xReader:
 
     def _init_sensor(self) -> None:
         try:
-            import board  # type: ignore
-            import busio  # type: ignore
             import adafruit_vl53l1x  # type: ignore
 
-            i2c = busio.I2C(board.SCL, board.SDA)
+            i2c = get_i2c()
             sensor = adafruit_vl53l1x.VL53L1X(i2c)
             try:
                 sensor.distance_mode = 2
@@ -42,70 +169,230 @@ class Vl53l1xReader:
             sensor.start_ranging()
             self._i2c = i2c
             self._sensor = sensor
+            raw = self._open_raw()
+            # Bound once so each poll skips the property/method lookups.
+            if raw is not None:
+                self._polled_ready = raw.data_ready
+                # The raw read clears the interrupt in the same transaction.
+                self._distance = raw.read_and_clear
+                self._clear_interrupt = None
+            else:
+                self._polled_ready = property_getter(sensor, "data_ready", True)
+                self._distance = _driver_distance_mm(property_getter(sensor, "distance"))
+                self._clear_interrupt = getattr(sensor, "clear_interrupt", None)
+            int_ready = None
+            if self._gpio_int_pin is not None:
+                if raw is not None:
+                    ready_level = raw.ready_level
+                else:
+                    # The driver exposes the configured polarity only privately.
+                    ready_level = int(getattr(sensor, "_interrupt_polarity", 1))
+                int_ready = self._interrupt_ready_getter(ready_level)
+            self._data_ready = int_ready or self._polled_ready
+            self._int_timeouts = 0
             self._available = True
             self._last_error = None
             _LOGGER.info("VL53L1X reader initialized")
             return
         except Exception as err:  # noqa: BLE001
-            err_text = str(err)
-            if err_text != self._last_error:
+            err_key = (type(err), err.args)
+            if err_key != self._last_error:
                 _LOGGER.warning("VL53L1X unavailable: %s", err)
-                self._last_error = err_text
+                self._last_error = err_key
 
+        self._close_raw()
         self._sensor = None
+        self._data_ready = self._not_ready
+        self._polled_ready = self._not_ready
+        self._distance = self._no_distance
+        self._clear_interrupt = None
         self._i2c = None
         self._available = False
 
+    @staticmethod
+    def _not_ready() -> bool:
+        return False
+
+    @staticmethod
+    def _no_distance() -> None:
+        return None
+
+    def _open_raw(self) -> Optional[_RawVl53l1x]:
+        """Open the smbus2 fast path when requested and available."""
+        self._close_raw()
+        if not self._raw_i2c:
+            return None
+        if SMBus is None:
+            _LOGGER.warning("VL53L1X raw I2C disabled: python package smbus2 not available")
+            self._raw_i2c = False
+            return None
+        bus = None
+        try:
+            bus = SMBus(VL53L1X_I2C_BUS)
+            self._raw = _RawVl53l1x(bus)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("VL53L1X raw I2C unavailable, using driver reads: %s", err)
+            if bus is not None:
+                bus.close()
+            return None
+        return self._raw
+
+    def _close_raw(self) -> None:
+        if self._raw is None:
+            return
+        try:
+            self._raw.close()
+        except Exception:  # noqa: BLE001
+            pass
+        self._raw = None
+
+    def _interrupt_ready_getter(self, ready_level: int) -> Optional[Callable[[], Any]]:
+        """Return a readiness check backed by the sensor's GPIO1 interrupt line.
+
+        GPIO1 stays at ``ready_level`` (the polarity read back from
+        GPIO_HV_MUX_CTRL) until the interrupt is cleared, so reading the pin
+        replaces the per-poll I2C read of the data_ready register. The
+        breakout drives/pulls the line itself, hence no internal pull resistor.
+        """
+        if self._gpio_int_pin is None:
+            return None
+        if (self._int_input is not None) and (self._int_ready_level != ready_level):
+            self._close_int_input()
+        if self._int_input is None:
+            if DigitalInputDevice is None:
+                _LOGGER.warning("VL53L1X interrupt pin ignored: python package gpiozero not available")
+                self._gpio_int_pin = None
+                return None
+            try:
+                self._int_input = DigitalInputDevice(
+                    self._gpio_int_pin,
+                    pull_up=None,
+                    active_state=bool(ready_level),
+                )
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("VL53L1X interrupt pin %s unavailable: %s", self._gpio_int_pin, err)
+                self._gpio_int_pin = None
+                return None
+            self._int_ready_level = ready_level
+            _LOGGER.info(
+                "VL53L1X data-ready from GPIO%s (active %s)",
+                self._gpio_int_pin,
+                "high" if ready_level else "low",
+            )
+        return property_getter(self._int_input, "is_active", True)
+
+    def _close_int_input(self) -> None:
+        if self._int_input is None:
+            return
+        try:
+            self._int_input.close()
+        except Exception:  # noqa: BLE001
+            pass
+        self._int_input = None
+        self._int_ready_level = None
+
+    def _fall_back_to_polling(self) -> None:
+        _LOGGER.warning(
+            "VL53L1X interrupt on GPIO%s missed %s reads in a row; polling data-ready over I2C instead",
+            self._gpio_int_pin,
+            self._int_timeouts,
+        )
+        self._close_int_input()
+        self._gpio_int_pin = None
+        self._data_ready = self._polled_ready
+
     def _maybe_reinit(self) -> None:
         now = time.monotonic()
-        if (now - self._last_reinit_at) < self._reinit_cooldown_s:
+        # Each full driver init is dozens of I2C writes: back off exponentially
+        # while the sensor keeps failing instead of retrying every cooldown.
+        cooldown = min(
+            VL53L1X_REINIT_MAX_COOLDOWN_S,
+            self._reinit_cooldown_s * (2 ** min(self._reinit_fail_count, 16)),
+        )
+        if (now - self._last_reinit_at) < cooldown:
             return
         self._last_reinit_at = now
         self._init_sensor()
+        if self._available:
+            self._reinit_fail_count = 0
+        else:
+            self._reinit_fail_count += 1
 
-    def _read_once(self) -> Optional[float]:
-        if (not self._available) or (self._sensor is None):
-            return None
+    def _read_once(self) -> tuple[bool, Optional[float]]:
+        """Poll once; returns ``(ready, distance_mm)``.
 
+        ``ready`` is False while no result is waiting or on I2C errors. A ready
+        result is always consumed, so an invalid or out-of-range measurement
+        yields ``(True, None)`` rather than leaving the interrupt raised.
+        Only called by ``_read_distance`` once the sensor is available.
+        """
         try:
-            if not bool(getattr(self._sensor, "data_ready", True)):
-                return None
-            value_cm = getattr(self._sensor, "distance", None)
-            if value_cm is None:
-                return None
-            value = float(value_cm) * 10.0
-            try:
-                self._sensor.clear_interrupt()
-            except Exception:  # noqa: BLE001
-                pass
+            if not bool(self._data_ready()):
+                return False, None
+            value = self._distance()
+            clear_interrupt = self._clear_interrupt
+            if clear_interrupt is not None:
+                # A failed clear is a bus error like any other: the result is
+                # dropped and, with the interrupt still raised, re-read.
+                clear_interrupt()
         except Exception as err:  # noqa: BLE001
-            err_text = str(err)
-            if err_text != self._last_error:
+            err_key = (type(err), err.args)
+            if err_key != self._last_error:
                 _LOGGER.warning("VL53L1X read failed: %s", err)
-                self._last_error = err_text
-            return None
+                self._last_error = err_key
+            return False, None
 
         self._last_error = None
-        if (value <= 0.0) or (value >= VL53L1X_MAX_MM):
-            return None
-        return value
+        if value is None:
+            return True, None
+        # Gate in the source's own numeric type (int mm on the raw path);
+        # convert once on the way out.
+        if (value <= 0) or (value >= VL53L1X_MAX_MM):
+            return True, None
+        return True, float(value)
 
     def read_distance_mm(self) -> Optional[float]:
+        value = self._read_distance()
+        self._smoother.add(value)
+        return value
+
+    def latest_smoothed_mm(self) -> Optional[float]:
+        """Smoothed distance over the last ``window`` reads, or None until stable."""
+        return self._smoother.value()
+
+    def _read_distance(self) -> Optional[float]:
         if not self._available:
             self._maybe_reinit()
             if not self._available:
                 return None
 
-        for attempt in range(self._max_read_retries + 1):
-            value = self._read_once()
-            if value is not None:
+        # Bound the wait by time, pausing between polls rather than hammering
+        # the bus; only a sensor that never becomes ready triggers a reinit.
+        deadline = time.monotonic() + self._read_deadline_s
+        while True:
+            ready, value = self._read_once()
+            if ready:
+                self._int_timeouts = 0
                 return value
-            if attempt < self._max_read_retries:
-                continue
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(VL53L1X_POLL_INTERVAL_S)
 
+        if self._int_input is not None:
+            # A silent interrupt line (wrong pin or wiring) is not fixed by a
+            # reinit; after a few misses switch to polling the sensor instead.
+            self._int_timeouts += 1
+            if self._int_timeouts >= VL53L1X_INT_TIMEOUT_LIMIT:
+                self._fall_back_to_polling()
+            return None
         self._maybe_reinit()
         return None
 
+    async def read_distance_mm_async(self) -> Optional[float]:
+        """``read_distance_mm`` in a worker thread, keeping I2C waits and
+        reinit attempts off the event loop."""
+        return await asyncio.to_thread(self.read_distance_mm)
+
     def read_mm(self) -> Optional[float]:
         return self.read_distance_mm()
 
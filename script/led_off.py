@@ -3,16 +3,25 @@
 
 from __future__ import annotations
 
+# Mirrors linux_voice_assistant.gpio_controller; importing that module would
+# pull the whole controller graph into the unit stop path.
+LED_GPIO = 12
+LED_COUNT = 14
+LED_BRIGHTNESS = 70
+
 
 def main() -> int:
     try:
-        from linux_voice_assistant.gpio_controller import Ws2812Bar, LED_BRIGHTNESS, LED_COUNT, LED_GPIO
+        from rpi_ws281x import PixelStrip  # type: ignore
+    except ImportError:
+        return 0
 
-        bar = Ws2812Bar(LED_GPIO, LED_COUNT, LED_BRIGHTNESS)
-        try:
-            bar.off()
-        finally:
-            bar.close()
+    try:
+        strip = PixelStrip(LED_COUNT, LED_GPIO, 800000, 10, False, LED_BRIGHTNESS, 0)
+        strip.begin()
+        for idx in range(LED_COUNT):
+            strip.setPixelColor(idx, 0)
+        strip.show()
         return 0
     except Exception:
         # Never fail unit stop path because of LED cleanup issues.
@@ -0,0 +1,116 @@
+import time
+
+from linux_voice_assistant.distance_poller import DistancePoller
+
+
+class _FakeReader:
+    available = True
+
+    def __init__(self, values) -> None:
+        self._values = list(values)
+
+    def read_distance_mm(self):
+        value = self._values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def test_poller_keeps_latest_value_per_reader() -> None:
+    near = _FakeReader([100.0, 110.0])
+    far = _FakeReader([900.0, None])
+    poller = DistancePoller([near, far])
+    assert poller.latest(near) is None
+
+    poller.poll_once()
+    assert (poller.latest(near), poller.latest(far)) == (100.0, 900.0)
+    poller.poll_once()
+    assert (poller.latest(near), poller.latest(far)) == (110.0, None)
+
+
+def test_poller_drops_stale_and_failed_reads(monkeypatch) -> None:
+    from linux_voice_assistant import distance_poller
+
+    clock = [10.0]
+    monkeypatch.setattr(distance_poller.time, "monotonic", lambda: clock[0])
+    reader = _FakeReader([250.0, OSError(121, "Remote I/O error")])
+    poller = DistancePoller([reader], interval_s=1.0, staleness_s=3.0)
+
+    poller.poll_once()
+    clock[0] += 3.5
+    assert poller.latest(reader) is None
+
+    poller.poll_once()
+    assert poller.latest(reader) is None
+
+
+def test_poller_thread_starts_and_stops() -> None:
+    reader = _FakeReader([42.0] * 1000)
+    poller = DistancePoller([reader], interval_s=0.01)
+    poller.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while poller.latest(reader) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert poller.latest(reader) == 42.0
+    finally:
+        poller.stop()
+    assert not poller._thread.is_alive()
+
+
+def test_poller_restart_waits_for_stopping_thread() -> None:
+    import threading
+
+    active = []
+    overlap = []
+    release = threading.Event()
+
+    class _SlowReader:
+        available = True
+
+        def read_distance_mm(self):
+            overlap.append(len(active))
+            active.append(True)
+            release.wait(0.2)
+            active.pop()
+            return 42.0
+
+    reader = _SlowReader()
+    samples = []
+    poller = DistancePoller([reader], interval_s=0.01)
+    poller.start()
+    time.sleep(0.05)
+    poller.stop(wait=False)
+    poller.subscribe(lambda: samples.append(True))
+    release.set()
+    time.sleep(0.05)
+    poller.stop()
+    assert samples
+    assert max(overlap) == 0
+
+
+def test_overlapping_subscribers_keep_polling() -> None:
+    reader = _FakeReader([42.0] * 10000)
+    poller = DistancePoller([reader], interval_s=0.01)
+    first: list[bool] = []
+    second: list[bool] = []
+
+    def on_first() -> None:
+        first.append(True)
+
+    def on_second() -> None:
+        second.append(True)
+
+    try:
+        poller.subscribe(on_first)
+        poller.subscribe(on_second)
+        thread = poller._thread
+        poller.unsubscribe(on_first)
+        first.clear()
+        second.clear()
+        time.sleep(0.1)
+        assert poller._thread is thread and thread.is_alive()
+        assert poller.latest(reader) == 42.0
+        assert second and not first
+    finally:
+        poller.stop()
@@ -0,0 +1,274 @@
+import ctypes
+
+import pytest
+
+from linux_voice_assistant.distance_reader import DistanceSmoother, property_getter
+
+
+class _FakeSensor:
+    def __init__(self) -> None:
+        self.reads = 0
+
+    @property
+    def range(self) -> int:
+        self.reads += 1
+        return 420
+
+
+def test_property_getter_binds_property() -> None:
+    sensor = _FakeSensor()
+    read_range = property_getter(sensor, "range")
+    assert read_range() == 420
+    assert read_range() == 420
+    assert sensor.reads == 2
+
+
+def test_property_getter_falls_back_to_default() -> None:
+    sensor = _FakeSensor()
+    assert property_getter(sensor, "data_ready", True)() is True
+    sensor.data_ready = False  # type: ignore[attr-defined]
+    assert property_getter(sensor, "data_ready", True)() is False
+
+
+class _FakeVl53l1xBus:
+    """Serves VL53L1X registers to smbus2 ``i2c_rdwr`` message pairs."""
+
+    def __init__(self, registers: dict[int, int]) -> None:
+        self.registers = registers
+        self.transactions = 0
+        self.writes: list[bytes] = []
+
+    def i2c_rdwr(self, *msgs) -> None:
+        self.transactions += 1
+        register = None
+        for msg in msgs:
+            if msg.flags & 0x0001:  # I2C_M_RD
+                data = bytes(self.registers.get(register + i, 0) for i in range(msg.len))
+                ctypes.memmove(msg.buf, data, msg.len)
+            else:
+                payload = bytes(msg)
+                register = int.from_bytes(payload[:2], "big")
+                if len(payload) > 2:
+                    self.writes.append(payload)
+
+    def close(self) -> None:
+        pass
+
+
+def test_raw_vl53l1x_reads_result_block() -> None:
+    pytest.importorskip("smbus2")
+    from linux_voice_assistant.vl53l1x_reader import _RawVl53l1x
+
+    bus = _FakeVl53l1xBus({0x30: 0x01, 0x31: 0x01, 0x89: 0x09, 0x96: 0x04, 0x97: 0xD2})
+    raw = _RawVl53l1x(bus)
+    assert raw.data_ready() is True
+    bus.transactions = 0
+    assert raw.read_and_clear() == 1234
+    assert bus.transactions == 1
+    assert bus.writes == [b"\x00\x86\x01"]
+
+    bus.registers[0x89] = 0x04
+    assert raw.read_and_clear() is None
+    assert len(bus.writes) == 2
+
+    # Reused message buffers must reflect each new transaction.
+    bus.registers.update({0x31: 0x00, 0x89: 0x09, 0x96: 0x00, 0x97: 0x64})
+    assert raw.data_ready() is False
+    assert raw.read_and_clear() == 100
+
+
+def test_vl53l1x_reinit_backs_off(monkeypatch) -> None:
+    from linux_voice_assistant import vl53l1x_reader
+
+    clock = [100.0]
+    monkeypatch.setattr(vl53l1x_reader.time, "monotonic", lambda: clock[0])
+    reader = vl53l1x_reader.Vl53l1xReader(reinit_cooldown_s=1.0)
+    attempts: list[float] = []
+    monkeypatch.setattr(reader, "_init_sensor", lambda: attempts.append(clock[0]))
+
+    for _ in range(1000):
+        assert reader.read_distance_mm() is None
+        clock[0] += 0.25
+
+    gaps = [b - a for a, b in zip(attempts, attempts[1:])]
+    assert gaps[:6] == [2.0, 4.0, 8.0, 16.0, 32.0, 60.0]
+
+
+def test_distance_smoother_waits_for_full_window() -> None:
+    smoother = DistanceSmoother(3)
+    smoother.add(100.0)
+    smoother.add(110.0)
+    assert smoother.value() is None
+    smoother.add(120.0)
+    assert smoother.value() == 110.0
+    smoother.add(130.0)
+    assert smoother.value() == 120.0
+
+
+def test_distance_smoother_drops_samples_on_missing_reads() -> None:
+    smoother = DistanceSmoother(3, use_median=True)
+    for value in (100.0, 400.0, 110.0):
+        smoother.add(value)
+    assert smoother.value() == 110.0
+    smoother.add(None)
+    assert smoother.value() is None
+    smoother.add(120.0)
+    assert smoother.value() == 120.0
+    for _ in range(3):
+        smoother.add(None)
+    smoother.add(90.0)
+    assert smoother.value() is None
+
+
+def test_get_i2c_shares_one_bus(monkeypatch) -> None:
+    import sys
+    import types
+
+    from linux_voice_assistant import _i2c_bus
+
+    opened: list[object] = []
+
+    class _FakeI2C:
+        def __init__(self, scl, sda) -> None:
+            opened.append(self)
+
+    monkeypatch.setitem(sys.modules, "board", types.SimpleNamespace(SCL=3, SDA=2))
+    monkeypatch.setitem(sys.modules, "busio", types.SimpleNamespace(I2C=_FakeI2C))
+    monkeypatch.setattr(_i2c_bus, "_I2C", None)
+
+    assert _i2c_bus.get_i2c() is _i2c_bus.get_i2c()
+    assert len(opened) == 1
+
+
+def _ready_reader(monkeypatch, data_ready, distance_mm):
+    from linux_voice_assistant.vl53l1x_reader import Vl53l1xReader
+
+    reader = Vl53l1xReader(read_deadline_s=0.01)
+    reinits: list[bool] = []
+    monkeypatch.setattr(reader, "_maybe_reinit", lambda: reinits.append(True))
+    cleared: list[bool] = []
+    reader._available = True
+    reader._data_ready = data_ready
+    reader._distance = lambda: distance_mm
+    reader._clear_interrupt = lambda: cleared.append(True)
+    return reader, reinits, cleared
+
+
+def test_vl53l1x_out_of_range_is_consumed_without_reinit(monkeypatch) -> None:
+    reader, reinits, cleared = _ready_reader(monkeypatch, lambda: True, None)
+    assert reader.read_distance_mm() is None
+    assert cleared == [True]
+    assert reinits == []
+
+    reader._distance = lambda: 125
+    assert reader.read_distance_mm() == 125.0
+
+
+def test_vl53l1x_driver_distance_converts_cm() -> None:
+    from linux_voice_assistant.vl53l1x_reader import _driver_distance_mm
+
+    assert _driver_distance_mm(lambda: 12.5)() == 125.0
+    assert _driver_distance_mm(lambda: None)() is None
+
+
+def test_vl53l1x_not_ready_until_deadline_reinits(monkeypatch) -> None:
+    polls: list[bool] = []
+    reader, reinits, cleared = _ready_reader(monkeypatch, lambda: polls.append(True), 125)
+    assert reader.read_distance_mm() is None
+    assert reinits == [True]
+    assert cleared == []
+    assert 1 < len(polls) < 10
+
+
+def test_vl53l1x_repeated_read_error_logged_once(monkeypatch, caplog) -> None:
+    def _fail():
+        raise OSError(121, "Remote I/O error")
+
+    reader, _, _ = _ready_reader(monkeypatch, _fail, 125)
+    reader._read_deadline_s = 0.0
+    with caplog.at_level("WARNING"):
+        for _ in range(3):
+            assert reader.read_distance_mm() is None
+    assert len([r for r in caplog.records if "read failed" in r.message]) == 1
+
+
+def test_vl53l0x_unavailable_reads_return_none(monkeypatch) -> None:
+    import sys
+
+    from linux_voice_assistant import vl53l0x_reader
+
+    monkeypatch.setitem(sys.modules, "adafruit_vl53l0x", None)
+    reader = vl53l0x_reader.Vl53l0xReader()
+    assert reader.available is False
+    assert reader.read_distance_mm() is None
+    assert reader.read_mm() is None
+    assert reader.latest_smoothed_mm() is None
+
+
+def test_vl53l0x_gates_raw_range_before_calibration(monkeypatch) -> None:
+    import sys
+
+    from linux_voice_assistant import vl53l0x_reader
+
+    monkeypatch.setitem(sys.modules, "adafruit_vl53l0x", None)
+    reader = vl53l0x_reader.Vl53l0xReader()
+    for raw, expected in ((8191, None), (0, None), (420, 420.0)):
+        reader._read_range = lambda raw=raw: raw
+        value = reader._read_distance()
+        assert value == expected
+        if expected is not None:
+            assert isinstance(value, float)
+
+
+def test_vl53l1x_failed_clear_drops_reading(monkeypatch) -> None:
+    reader, reinits, _ = _ready_reader(monkeypatch, lambda: True, 125)
+    reader._read_deadline_s = 0.0
+
+    def _fail_clear():
+        raise OSError(121, "Remote I/O error")
+
+    reader._clear_interrupt = _fail_clear
+    assert reader.read_distance_mm() is None
+    assert reinits == [True]
+
+
+class _FakeInputDevice:
+    def __init__(self, pin, *, pull_up, active_state) -> None:
+        self.pin = pin
+        self.active_state = active_state
+        self.is_active = False
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_vl53l1x_interrupt_pin_follows_sensor_polarity(monkeypatch) -> None:
+    from linux_voice_assistant import vl53l1x_reader
+
+    monkeypatch.setattr(vl53l1x_reader, "DigitalInputDevice", _FakeInputDevice)
+    reader = vl53l1x_reader.Vl53l1xReader(gpio_int_pin=27)
+    assert reader._interrupt_ready_getter(0) is not None
+    active_low = reader._int_input
+    assert active_low.active_state is False
+
+    reader._interrupt_ready_getter(1)
+    assert active_low.closed
+    assert reader._int_input.active_state is True
+
+
+def test_vl53l1x_silent_interrupt_falls_back_to_polling(monkeypatch) -> None:
+    from linux_voice_assistant import vl53l1x_reader
+
+    monkeypatch.setattr(vl53l1x_reader, "DigitalInputDevice", _FakeInputDevice)
+    reader, reinits, _ = _ready_reader(monkeypatch, lambda: False, 125)
+    reader._read_deadline_s = 0.0
+    reader._gpio_int_pin = 27
+    reader._data_ready = reader._interrupt_ready_getter(1)
+    reader._polled_ready = lambda: True
+
+    for _ in range(vl53l1x_reader.VL53L1X_INT_TIMEOUT_LIMIT):
+        assert reader.read_distance_mm() is None
+    assert reinits == []
+    assert reader._int_input is None
+    assert reader.read_distance_mm() == 125.0
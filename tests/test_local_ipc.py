@@ -0,0 +1,69 @@
+from linux_voice_assistant.local_ipc import (
+    build_message,
+    decode_packet,
+    encode_message,
+    normalize_message,
+)
+
+
+def test_encode_decode_round_trip() -> None:
+    message = build_message(
+        "VISION_GLANCE_RESULT",
+        {"request_id": "abc", "state": "FACE_TOWARD", "confidence": 0.75},
+        source="visd",
+        ts=12.5,
+    )
+    encoded = encode_message(message)
+    assert isinstance(encoded, bytes)
+    assert b" " not in encoded
+    assert decode_packet(encoded) == message
+
+
+def test_normalize_decoded_legacy_command() -> None:
+    packet = decode_packet(b'{"cmd":"Mute"}')
+    assert isinstance(packet, dict)
+    message = normalize_message(packet)
+    assert message is not None
+    assert message["type"] == "MUTE"
+    assert message["payload"] == {"command": "mute"}
+
+
+def test_encode_falls_back_for_payloads_orjson_rejects() -> None:
+    import numpy as np
+
+    message = build_message(
+        "VISION_GLANCE_RESULT",
+        {"confidence": np.float64(0.5), "counts": {1: "face"}},
+        source="visd",
+        ts=1.0,
+    )
+    decoded = decode_packet(encode_message(message))
+    assert isinstance(decoded, dict)
+    assert decoded["payload"] == {"confidence": 0.5, "counts": {"1": "face"}}
+
+
+def test_ipc_drain_reports_truncated_packets(monkeypatch, caplog) -> None:
+    import socket
+
+    from linux_voice_assistant.visd import __main__ as visd_main
+    from linux_voice_assistant.visd.detector import Detector
+
+    monkeypatch.setattr(visd_main, "_IPC_MAX_PACKET", 256)
+    daemon = visd_main.VisionDaemon(Detector())
+    handled: list[dict] = []
+    monkeypatch.setattr(daemon, "handle_message", handled.append)
+
+    reader, writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        reader.setblocking(False)
+        daemon._ipc_socket = reader
+        writer.send(encode_message(build_message("VISION_GLANCE_REQUEST", {"pad": "x" * 512})))
+        writer.send(encode_message(build_message("VISION_GLANCE_REQUEST", {"request_id": "a"})))
+        with caplog.at_level("WARNING"):
+            daemon._drain_ipc_socket()
+    finally:
+        reader.close()
+        writer.close()
+
+    assert [m["payload"] for m in handled] == [{"request_id": "a"}]
+    assert "larger than 256 bytes" in caplog.text
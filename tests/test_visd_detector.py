@@ -0,0 +1,49 @@
+import numpy as np
+
+from linux_voice_assistant.visd.detector import (
+    DetectionResult,
+    Detector,
+    SimpleFaceGlanceDetector,
+)
+
+
+class _CountingDetector(Detector):
+    def __init__(self) -> None:
+        self.resets = 0
+        self.seen: list[int] = []
+
+    def reset(self) -> None:
+        self.resets += 1
+        self.seen = []
+
+    def analyze_one(self, frame) -> DetectionResult:
+        self.seen.append(frame)
+        return DetectionResult(state="FACE_AWAY", confidence=float(len(self.seen)) / 10.0)
+
+
+def test_analyze_folds_frames_incrementally() -> None:
+    detector = _CountingDetector()
+    result = detector.analyze([1, 2, 3])
+    assert detector.resets == 1
+    assert detector.seen == [1, 2, 3]
+    assert result.confidence == 0.3
+
+    result = detector.analyze([4])
+    assert detector.resets == 2
+    assert detector.seen == [4]
+    assert result.confidence == 0.1
+
+
+def test_analyze_without_frames_is_no_face() -> None:
+    result = _CountingDetector().analyze([])
+    assert result.state == "NO_FACE"
+    assert result.confidence == 0.0
+
+
+def test_simple_detector_accepts_gray_and_bgr_frames() -> None:
+    detector = SimpleFaceGlanceDetector()
+    gray = np.zeros((240, 320), dtype=np.uint8)
+    bgr = np.zeros((240, 320, 3), dtype=np.uint8)
+    result = detector.analyze([gray, bgr])
+    assert result.state == "NO_FACE"
+    assert result.face_box is None
@@ -0,0 +1,26 @@
+from linux_voice_assistant.visd.__main__ import _etag_matches, _http_header_template
+
+
+def test_http_header_template_extra_header_slot() -> None:
+    header = _http_header_template(200, "image/jpeg") % b"Content-Length: 1234\r\n"
+    assert header.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"Content-Type: image/jpeg\r\n" in header
+    assert b"Content-Length: 1234\r\n" in header
+    assert b"no-store" in header
+    assert header.endswith(b"\r\n\r\n")
+
+
+def test_http_header_template_revalidate_allows_conditional_requests() -> None:
+    header = _http_header_template(304, "image/jpeg", revalidate=True) % b""
+    assert header.startswith(b"HTTP/1.1 304 Not Modified\r\n")
+    assert b"no-store" not in header
+    assert b"Content-Length" not in header
+
+
+def test_etag_matches() -> None:
+    assert _etag_matches('"abc"', "abc")
+    assert _etag_matches('W/"abc"', "abc")
+    assert _etag_matches('"old", "abc"', "abc")
+    assert _etag_matches("*", "abc")
+    assert not _etag_matches('"old"', "abc")
+    assert not _etag_matches('"abc"', "")
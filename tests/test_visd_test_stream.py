@@ -1,7 +1,15 @@
+import json
+import os
+
+from linux_voice_assistant.visd import test_stream
 from linux_voice_assistant.visd.test_stream import (
     STREAM_HOST,
     STREAM_PORT,
+    StreamState,
     _detect_local_ips,
+    _enable_opencl,
+    _extract_latest_jpeg,
+    _load_vision_settings,
     _build_overlay_lines,
     _clamp_confidence,
     build_parser,
@@ -53,3 +61,96 @@ def test_detect_local_ips_returns_strings() -> None:
     ips = _detect_local_ips()
     assert isinstance(ips, list)
     assert all(isinstance(ip, str) for ip in ips)
+
+
+def test_detect_local_ips_falls_back_off_linux(monkeypatch) -> None:
+    monkeypatch.setattr(test_stream.sys, "platform", "darwin")
+    assert test_stream._getifaddrs_ipv4() is None
+    ips = _detect_local_ips()
+    assert all(not ip.startswith("127.") for ip in ips)
+
+
+def test_extract_latest_jpeg_keeps_partial_frame() -> None:
+    first = b"\xff\xd8one\xff\xd9"
+    second = b"\xff\xd8two\xff\xd9"
+    buf = bytearray(b"junk" + first + second + b"\xff\xd8par")
+    assert _extract_latest_jpeg(buf) == second
+    assert buf == bytearray(b"\xff\xd8par")
+
+    buf += b"tial\xff\xd9"
+    assert _extract_latest_jpeg(buf) == b"\xff\xd8partial\xff\xd9"
+    assert buf == bytearray()
+
+
+def test_extract_latest_jpeg_without_frame_start() -> None:
+    buf = bytearray(b"noise\xff")
+    assert _extract_latest_jpeg(buf) is None
+    assert buf == bytearray(b"\xff")
+
+
+def test_load_vision_settings_reloads_only_on_change(tmp_path, monkeypatch) -> None:
+    prefs_path = tmp_path / "preferences.json"
+    prefs_path.write_text(json.dumps({"vision_min_confidence": 0.7}), encoding="utf-8")
+    config_path = tmp_path / "config.json"
+    config_path.write_text(
+        json.dumps({"core": {"preferences_file": str(prefs_path)}}),
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("LVA_CONFIG_PATH", str(config_path))
+    monkeypatch.setattr(test_stream, "_vision_settings_cache", {})
+
+    first = _load_vision_settings()
+    assert first.min_confidence == 0.7
+    assert _load_vision_settings() is first
+
+    prefs_path.write_text(json.dumps({"vision_min_confidence": 0.55}), encoding="utf-8")
+    stat = prefs_path.stat()
+    os.utime(prefs_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = _load_vision_settings()
+    assert second is not first
+    assert second.min_confidence == 0.55
+
+
+def test_enable_opencl_requires_device() -> None:
+    class _Ocl:
+        def __init__(self, available: bool) -> None:
+            self.available = available
+            self.enabled = False
+
+        def haveOpenCL(self) -> bool:
+            return self.available
+
+        def setUseOpenCL(self, flag: bool) -> None:
+            self.enabled = flag
+
+        def useOpenCL(self) -> bool:
+            return self.enabled
+
+    class _Cv2:
+        def __init__(self, available: bool) -> None:
+            self.ocl = _Ocl(available)
+
+        def setUseOptimized(self, _flag: bool) -> None:
+            pass
+
+    missing = _Cv2(False)
+    assert _enable_opencl(missing) is False
+    assert missing.ocl.enabled is False
+    assert _enable_opencl(_Cv2(True)) is True
+
+
+def test_stream_state_publish_swaps_snapshot() -> None:
+    state = StreamState()
+    state.publish({"state": "BOOTING"})
+    booting = state.current
+    assert booting.frame_seq == 0
+    assert booting.frame_jpeg == b""
+
+    state.publish({"state": "NO_FACE"}, frame_jpeg=b"frame", overlay_jpeg=b"overlay")
+    state.publish({"state": "FACE_TOWARD"}, frame_jpeg=b"next")
+    current = state.current
+    assert current.frame_seq == 2
+    assert current.frame_jpeg == b"next"
+    assert current.overlay_jpeg == b"overlay"
+    assert current.status == {"state": "FACE_TOWARD"}
+    assert booting.status == {"state": "BOOTING"}